@@ -3,7 +3,7 @@ Core measurement modules for Taiwan Market Watch
 """
 from .measure_value import MeasureValue
 from .measure_score import MeasureScore
-from .data_fetcher import DataFetcher, DateLike
+from .data_fetcher import DataFetcher, DateLike, EmptyDataError
 from .config import Config
 
-__all__ = ['MeasureValue', 'MeasureScore', 'DataFetcher', 'DateLike', 'Config']
+__all__ = ['MeasureValue', 'MeasureScore', 'DataFetcher', 'DateLike', 'EmptyDataError', 'Config']
@@ -0,0 +1,76 @@
+"""
+On-disk Parquet cache for fetched DataFrames, plus the in-process measure profile cache
+"""
+from __future__ import annotations
+import functools
+import hashlib
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import orjson
+import pandas as pd
+from .config import Config
+
+
+def _digest(key_parts: tuple) -> str:
+    return hashlib.md5("|".join(str(p) for p in key_parts).encode("utf-8")).hexdigest()
+
+
+def cache_path(namespace: str, *key_parts: Any) -> Path:
+    """Build the cache file path for a request identified by key_parts"""
+    return Path(Config.CACHE_DIR) / namespace / f"{_digest(key_parts)}.parquet"
+
+
+def cache_dir(namespace: str, *key_parts: Any) -> Path:
+    """Build the cache directory for files that share key_parts (e.g. one engine), named by the caller"""
+    return Path(Config.CACHE_DIR) / namespace / _digest(key_parts)
+
+
+def load_frame(path: Path, ttl: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """Return the cached frame, or None on a miss, an expired entry or when caching is disabled"""
+    if not Config.USE_CACHE or not path.exists():
+        return None
+
+    ttl = Config.CACHE_TTL if ttl is None else ttl
+    if ttl > 0 and time.time() - path.stat().st_mtime > ttl:
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+
+def save_frame(path: Path, df: pd.DataFrame) -> None:
+    """Write df to the cache; failures only print a warning"""
+    if not Config.USE_CACHE:
+        return
+
+    # Write to a unique temp file first so concurrent readers never see a partial file
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(path)
+    except (OSError, ValueError, TypeError) as e:
+        tmp_path.unlink(missing_ok=True)
+        print(f"Failed to write cache file {path}: {e}")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_profile_cached(path_str: str, mtime_ns: int, encoding: str) -> Dict[str, Dict[str, Any]]:
+    # mtime_ns is only part of the key, so an edited profile is parsed again
+    return orjson.loads(Path(path_str).read_text(encoding=encoding))
+
+
+def load_measure_profile(profile_path: Union[str, Path], encoding: str = "utf-8-sig") -> Dict[str, Dict[str, Any]]:
+    """
+    Parse a measure_profile JSON file once per (path, mtime).
+
+    The returned dict is shared between callers (e.g. MeasureScore and its MeasureValue)
+    and must be treated as read-only.
+    """
+    path = Path(profile_path).resolve()
+    return _load_profile_cached(str(path), path.stat().st_mtime_ns, encoding)
@@ -3,5 +3,11 @@ import os
 class Config:
     API_URL = os.getenv("API_URL", "https://api1.dottdot.com/api/indistock")
     API_KEY = os.getenv("API_KEY", "guest")
+    API_TIMEOUT = (3, 30)  # (connect, read) seconds
     DEFAULT_ENCODING = "utf-8-sig"
     DEFAULT_DATE_FORMAT = "%Y/%m/%d"
+    CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+    CACHE_TTL = int(os.getenv("CACHE_TTL", "43200"))  # seconds, 0 = never expire
+    MEASURE_CACHE_TTL = int(os.getenv("MEASURE_CACHE_TTL", "604800"))  # seconds between full refetches of a measure history
+    USE_CACHE = os.getenv("NO_CACHE", "").lower() not in ("1", "true", "yes")
+    MAX_WORKERS = int(os.getenv("MAX_WORKERS", "8"))  # concurrent measure fetches in compute_all
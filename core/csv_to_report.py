@@ -8,12 +8,13 @@ an Excel report with historical values, latest values, scores, and summary.
 """
 
 import pandas as pd
-import json
 import os
 import argparse
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from .config import Config
+from .cache import load_measure_profile
+from .csv_writer import write_csv
 
 class CSVToReportGenerator:
     
@@ -26,7 +27,10 @@ class CSVToReportGenerator:
         self.score_file = score_file
         self.measure_profile_file = measure_profile_file
         self.frequency = frequency
-        
+        self._measure_profile: Optional[Dict] = None
+        self._category_order: Dict[str, int] = {}
+        self._measure_order: Dict[str, int] = {}
+
     def clean_column_name(self, col_name: str) -> str:
         """Clean column names by removing extra spaces and newlines"""
         return col_name.strip().replace('\n', '')
@@ -35,8 +39,9 @@ class CSVToReportGenerator:
         """
         Load and clean data from input files
         """
-        value_df = pd.read_csv(self.value_file, encoding='utf-8-sig')
-        score_df = pd.read_csv(self.score_file, encoding='utf-8-sig')
+        # pyarrow's multithreaded reader also infers ISO dates as timestamps on read
+        value_df = pd.read_csv(self.value_file, encoding='utf-8-sig', engine='pyarrow')
+        score_df = pd.read_csv(self.score_file, encoding='utf-8-sig', engine='pyarrow')
 
         # Ensure 'Date' column is present
         if 'Date' not in value_df.columns or 'Date' not in score_df.columns:
@@ -50,11 +55,16 @@ class CSVToReportGenerator:
         value_df.columns = [self.clean_column_name(col) for col in value_df.columns]
         score_df.columns = [self.clean_column_name(col) for col in score_df.columns]
         
-        # Load JSON measure_profile with utf-8 encoding
-        with open(self.measure_profile_file, 'r', encoding='utf-8') as f:
-            measure_profile = json.load(f)
-            
-        return value_df, score_df, measure_profile
+        return value_df, score_df, self.load_measure_profile()
+
+    def load_measure_profile(self) -> Dict:
+        """Load the JSON measure_profile once and memoise the derived sort orders"""
+        if self._measure_profile is None:
+            # Shared (path, mtime)-keyed orjson loader, also used by MeasureValue / MeasureScore
+            self._measure_profile = load_measure_profile(self.measure_profile_file, encoding='utf-8')
+            self._category_order = self.get_category_order(self._measure_profile)
+            self._measure_order = self.get_measure_order(self._measure_profile)
+        return self._measure_profile
     
     def get_measure_category(self, measure_id: str, measure_profile: Dict) -> str:
         """Get the category of a measure from measure_profile"""
@@ -72,6 +82,10 @@ class CSVToReportGenerator:
                 categories_seen[category] = order
                 order += 1
         return categories_seen
+
+    def get_measure_order(self, measure_profile: Dict) -> Dict[str, int]:
+        """Get measure order (keyed by measure name) based on the order in measure_profile"""
+        return {measure_profile[mid]['name']: i for i, mid in enumerate(measure_profile.keys())}
     
     def create_report_sheet(self, 
                             display_period: tuple,
@@ -81,57 +95,49 @@ class CSVToReportGenerator:
         """
         Create the main report dataframe with proper column layout
         """
-        report_data = []
-        # filter value_df and score_df by display_period
+        # filter value_df and score_df by display_period ('Date' is already datetime64, see load_data)
         start_date, end_date = pd.to_datetime(display_period[0]), pd.to_datetime(display_period[1])
-        value_df = value_df[(pd.to_datetime(value_df['Date']) >= start_date) & (pd.to_datetime(value_df['Date']) <= end_date)]
-        score_df = score_df[(pd.to_datetime(score_df['Date']) >= start_date) & (pd.to_datetime(score_df['Date']) <= end_date)]
-
-        # Get date columns for historical values
-        date_columns = value_df['Date'].tolist()
-        
-        # Process each measure
-        measure_columns = [col for col in value_df.columns if col != 'Date']
-        
-        for measure_id in measure_columns:
-            if measure_id not in measure_profile:
-                continue               
-           
-            # Get historical values
-            historical_values = value_df[measure_id].tolist()            
-           
-            row = {
-                'category': self.get_measure_category(measure_id, measure_profile),
-                'measure_name': measure_profile[measure_id]['name'],
-                'unit': measure_profile[measure_id].get('unit', ''),
-            }
-
-            for date, value in zip(date_columns, historical_values):
-                row[datetime.strftime(date, '%Y-%m-%d')] = value
-
-            # Get latest score
-            if not score_df.empty and measure_id in score_df.columns:
-                 row['score'] = score_df[measure_id].iloc[-1]
-            else:
-                 row['score'] = 0
-
-            report_data.append(row)
-        
+        value_df = value_df.loc[value_df['Date'].between(start_date, end_date)]
+        score_df = score_df.loc[score_df['Date'].between(start_date, end_date)]
 
-        # Convert to DataFrame
-        report_df = pd.DataFrame(report_data)
-        if report_df.empty:
+        measure_ids = [col for col in value_df.columns if col != 'Date' and col in measure_profile]
+        if not measure_ids:
             return pd.DataFrame()
 
+        # Historical values: (Date x measure) -> (measure x Date) in one transpose
+        hist = value_df.set_index('Date')[measure_ids].T
+        hist.columns = pd.DatetimeIndex(hist.columns).strftime('%Y-%m-%d')
+
+        meta = pd.DataFrame({
+            'category': [self.get_measure_category(mid, measure_profile) for mid in measure_ids],
+            'measure_name': [measure_profile[mid]['name'] for mid in measure_ids],
+            'unit': [measure_profile[mid].get('unit', '') for mid in measure_ids],
+        }, index=measure_ids)
+
+        # Latest score per measure, 0 when the measure has no score column
+        if not score_df.empty:
+            latest = score_df.drop(columns='Date').iloc[-1]
+            scores = latest.reindex(measure_ids).where(pd.Index(measure_ids).isin(latest.index), 0)
+        else:
+            scores = pd.Series(0, index=measure_ids)
+
+        report_df = meta.join(hist).assign(score=scores).reset_index(drop=True)
+
         # sum of scores by category
-        report_df['score_total'] = report_df.groupby('category')['score'].transform('sum')
+        category_totals = report_df.groupby('category', sort=False)['score'].sum()
+        report_df['score_total'] = report_df['category'].map(category_totals)
+
+        # Sort orders are memoised for the generator's own profile
+        if measure_profile is self._measure_profile:
+            category_order, measure_order = self._category_order, self._measure_order
+        else:
+            category_order = self.get_category_order(measure_profile)
+            measure_order = self.get_measure_order(measure_profile)
 
         # Sort by category order from measure_profile
-        category_order = self.get_category_order(measure_profile)
         report_df['category_order'] = report_df['category'].map(category_order).fillna(999)
         
         # Create measure order based on the order in measure_profile
-        measure_order = {measure_profile[mid]['name']: i for i, mid in enumerate(measure_profile.keys())}
         report_df['measure_order'] = report_df['measure_name'].map(measure_order).fillna(999)
         
         report_df = report_df.sort_values(by=['category_order', 'measure_order'])
@@ -173,7 +179,7 @@ class CSVToReportGenerator:
             'score_total': '類別總分'
         }
         report_df = report_df.rename(columns=rename_dict)
-        report_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        write_csv(report_df, output_file, encoding='utf-8-sig')
         print(f"Report generated: {output_file}")
 
 def main():
@@ -0,0 +1,61 @@
+"""
+CSV output shared by the measure and report modules
+"""
+from __future__ import annotations
+import codecs
+import re
+from pathlib import Path
+from typing import Optional, Union
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# '%Y-%m-%d', '%Y/%m/%d', ...: year-month-day with one separator, formatted without strftime
+_YMD_FORMAT = re.compile(r"%Y(\W?)%m\1%d")
+
+
+def _format_index(index: pd.Index, date_format: Optional[str]) -> np.ndarray:
+    """Index labels as strings; a tz-naive DatetimeIndex is formatted with date_format"""
+    if not isinstance(index, pd.DatetimeIndex) or not date_format:
+        return index.astype(str)
+
+    match = _YMD_FORMAT.fullmatch(date_format)
+    if match is None or index.tz is not None or index.hasnans:
+        return index.strftime(date_format)
+    # numpy renders datetime64[D] as 'YYYY-MM-DD' in C, so only the separator needs replacing
+    labels = np.datetime_as_string(index.values.astype("datetime64[D]"))
+    sep = match.group(1)
+    return labels if sep == "-" else np.char.replace(labels, "-", sep)
+
+
+def write_csv(
+    df: pd.DataFrame,
+    output_path: Union[str, Path],
+    encoding: str = "utf-8-sig",
+    index_label: Optional[str] = None,
+    date_format: Optional[str] = None,
+) -> None:
+    """
+    Write df to CSV using pyarrow's C++ writer.
+
+    The index is only written when index_label is given, as the first column under that name;
+    a DatetimeIndex is formatted with date_format. df itself is never modified.
+
+    pyarrow only emits UTF-8, so 'utf-8-sig' is handled by writing the BOM first;
+    any other encoding falls back to pandas.
+    """
+    codec = codecs.lookup(encoding).name
+    if codec not in ("utf-8", "utf-8-sig"):
+        df.to_csv(output_path, index=index_label is not None, index_label=index_label,
+                  date_format=date_format, encoding=encoding)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if index_label is not None:
+        table = table.add_column(0, index_label, pa.array(_format_index(df.index, date_format), type=pa.string()))
+
+    with open(output_path, "wb") as f:
+        if codec == "utf-8-sig":
+            f.write(codecs.BOM_UTF8)
+        pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=True))
@@ -2,18 +2,122 @@
 Data fetching utilities shared across measure modules
 """
 from __future__ import annotations
+import functools
+import re
+import threading
+from operator import itemgetter
+from pathlib import Path
+import orjson
 import pandas as pd
 import requests
-from typing import Optional, Dict, Any, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Union
 from datetime import date
 from sqlalchemy import text
+from sqlalchemy.engine import URL
+from sqlalchemy.sql.elements import TextClause
 from .config import Config
+from .cache import cache_path, load_frame, save_frame
+
+try:  # optional: HTTP-level cache with ETag / Last-Modified revalidation
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:  # optional: Rust reader that decodes the MySQL/Postgres wire format straight into arrays
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+CONNECTORX_DIALECTS = ("mysql", "postgresql")
 
 DateLike = Union[str, date, pd.Timestamp]
 
 
+class EmptyDataError(ValueError):
+    """A fetch matched no rows for the requested range"""
+
+
+@functools.lru_cache(maxsize=256)
+def _text_clause(sql: str) -> TextClause:
+    """text(sql), built once per distinct SQL string"""
+    return text(sql)
+
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _is_iso_date(value: str) -> bool:
+    """True for a 'YYYY-MM-DD' string naming a real calendar day (not e.g. '2024-13-45')"""
+    if not _ISO_DATE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def format_date(value: DateLike, fmt: str) -> str:
+    """
+    Format one date; pd.Timestamp is a direct scalar constructor, unlike the pd.to_datetime dispatcher.
+    Strings and tz-naive values are memoised, since compute_all formats the same start / end pair for every measure.
+    """
+    # tz-aware values of one instant compare (and hash) equal in every zone but format differently
+    if getattr(value, "tzinfo", None) is not None:
+        return _format_date(value, fmt)
+    return _format_date_cached(value, fmt)
+
+
+def _format_date(value: DateLike, fmt: str) -> str:
+    # 'YYYY-MM-DD' strings already hold the two formats the queries use, so they are only sliced
+    # Anything else, invalid dates included, goes through pd.Timestamp and raises its parse error
+    if isinstance(value, str) and _is_iso_date(value):
+        if fmt == '%Y-%m-%d':
+            return value
+        if fmt == '%Y%m':
+            return value[:4] + value[5:7]
+    return pd.Timestamp(value).strftime(fmt)
+
+
+_format_date_cached = functools.lru_cache(maxsize=256)(_format_date)
+
+
 class DataFetcher:
     """Utility class for fetching data from API and database"""
+
+    # Query parameters shared by every API call
+    _BASE_PARAMS: Dict[str, str] = {'format': 'json', 'api_key': Config.API_KEY}
+
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Shared keep-alive session so repeated API calls reuse pooled connections"""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=16,
+                        pool_maxsize=32,
+                        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+                    )
+                    if requests_cache is not None and Config.USE_CACHE:
+                        session = requests_cache.CachedSession(
+                            str(Path(Config.CACHE_DIR) / "http"),
+                            backend="sqlite",
+                            expire_after=Config.CACHE_TTL or requests_cache.NEVER_EXPIRE,
+                            cache_control=True,
+                            stale_if_error=True,
+                        )
+                    else:
+                        session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
     
     @staticmethod
     def detect_date_column(df: pd.DataFrame) -> str:
@@ -24,6 +128,21 @@ class DataFetcher:
                 return col
         raise ValueError("No date-like column found in DataFrame")
     
+    @staticmethod
+    def _records_to_columns(data: List[Dict[str, Any]]) -> Dict[str, list]:
+        """Transpose API records (one dict per row) into one list per field in a single pass"""
+        if not data:
+            return {}
+
+        keys = list(data[0])
+        try:
+            getter = itemgetter(*keys)
+            rows = [getter(record) for record in data] if len(keys) > 1 else [(getter(record),) for record in data]
+        except KeyError:
+            # Ragged records: missing fields become None, as the API would have sent null
+            rows = [tuple(record.get(key) for key in keys) for record in data]
+        return {key: list(values) for key, values in zip(keys, zip(*rows))}
+
     @staticmethod
     def fetch_from_api(
         stock_id: str,
@@ -32,53 +151,115 @@ class DataFetcher:
         end_date: DateLike,
     ) -> pd.DataFrame:
         """Fetch data from the API"""
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+        start_str = format_date(start_date, '%Y-%m-%d')
+        end_str = format_date(end_date, '%Y-%m-%d')
+
+        path = cache_path("api", stock_id, field, start_str, end_str)
+        # A range that ended before today can no longer change, so it never expires
+        historical = pd.Timestamp(end_str) < pd.Timestamp.today().normalize()
+        cached = load_frame(path, ttl=0 if historical else None)
+        if cached is not None:
+            return cached
 
         params = {
+            **DataFetcher._BASE_PARAMS,
             'stock_id': stock_id,
             'start': start_str,
             'end': end_str,
             'fields': field,
-            'format': 'json',
-            'api_key': Config.API_KEY
         }
 
         try:
-            response = requests.get(Config.API_URL, params=params)
+            response = DataFetcher.get_session().get(Config.API_URL, params=params, timeout=Config.API_TIMEOUT)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             if result.get("status") != "success":
                 raise ValueError(f"API returned error status: {result.get('status')}")
             
             data = result.get("data", {}).get(stock_id, {}).get("data", [])
-            df = pd.DataFrame.from_records(data)
+            df = pd.DataFrame(DataFetcher._records_to_columns(data))
             
             date_col = DataFetcher.detect_date_column(df)
-            df[date_col] = pd.to_datetime(df[date_col])
-            df.set_index(date_col, inplace=True)
+            df = df.set_index(date_col)
+            df.index = pd.to_datetime(df.index, format='ISO8601', cache=True)
 
+            save_frame(path, df)
             return df
 
         except requests.RequestException as e:
             raise ConnectionError(f"API request failed: {e}")
     
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _connectorx_url(url: URL) -> str:
+        """connectorx connection string for an engine URL, rendered once per engine"""
+        # Driver options such as pymysql's charset are not understood by connectorx
+        url = url.set(drivername=url.get_backend_name(), query={})
+        return url.render_as_string(hide_password=False)
+
+    @staticmethod
+    def _read_sql_connectorx(
+        clause: TextClause,
+        engine,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Run query through connectorx; None when it is not installed or cannot handle the engine"""
+        if cx is None or engine.dialect.name not in CONNECTORX_DIALECTS:
+            return None
+
+        try:
+            # connectorx takes no bind parameters, so let the dialect render them as escaped literals
+            used = {k: v for k, v in (params or {}).items() if re.search(rf":{k}\b", clause.text)}
+            sql = str(clause.bindparams(**used).compile(
+                dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            return cx.read_sql(DataFetcher._connectorx_url(engine.url), sql, return_type="pandas")
+        except Exception as e:
+            print(f"connectorx failed, falling back to pandas.read_sql: {e}")
+            return None
+
     @staticmethod
     def fetch_from_db(
-        field: str,
-        query: str,
+        field: Union[str, List[str]],
+        query: Union[str, TextClause],
         engine,
         params: Optional[Dict[str, Any]] = None,
-    ) -> pd.Series:
-        """Fetch data from the database"""
-        try:        
-            df = pd.read_sql(text(query), engine, params=params)
-            
-            date_col = DataFetcher.detect_date_column(df)
-            df[date_col] = pd.to_datetime(df[date_col])
-            df.set_index(date_col, inplace=True)
-                        
-            return df[field]
+        chunksize: int = 50_000,
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Fetch data from the database; a list of fields returns a DataFrame.
+
+        Rows are read chunksize at a time and only the date and field columns of each chunk
+        are kept, so peak memory no longer scales with every selected column. Non-empty results
+        are cached on disk, keyed by the engine URL, query, params and fields.
+        """
+        fields = [field] if isinstance(field, str) else list(field)
+        # A prebuilt TextClause (see MeasureValue._ta_query) skips re-parsing the SQL on every call;
+        # raw strings share one TextClause per distinct SQL text
+        clause = query if isinstance(query, TextClause) else _text_clause(query)
+        path = cache_path("db", engine.url, clause.text, sorted((params or {}).items()), fields)
+        cached = load_frame(path)
+        if cached is not None:
+            return cached[field]
+
+        try:
+            df = DataFetcher._read_sql_connectorx(clause, engine, params)
+            if df is not None:
+                date_col = DataFetcher.detect_date_column(df)
+                df = df[[date_col, *fields]]
+            else:
+                chunks = []
+                for chunk in pd.read_sql(clause, engine, params=params, chunksize=chunksize):
+                    date_col = DataFetcher.detect_date_column(chunk)
+                    chunks.append(chunk[[date_col, *fields]])
+                df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+            df = df.set_index(date_col)
+            # All date columns here are ISO 8601 (YYYY-MM-DD or CONCAT(年月,'01')), so skip format sniffing
+            df.index = pd.to_datetime(df.index, format='ISO8601', cache=True)
         except Exception as e:
             raise RuntimeError(f"Database query failed: {e}")
+
+        if not df.empty:
+            save_frame(path, df)
+        return df[field]
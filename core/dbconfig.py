@@ -1,17 +1,21 @@
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import dotenv_values
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Mapping
+from .config import Config
 
 
-def default_dbconfig(schema: Optional[str] = None) -> Dict[str, Any]:
+@lru_cache(maxsize=8)
+def default_dbconfig(schema: Optional[str] = None) -> Mapping[str, Any]:
     """
-    從 .env 檔案載入資料庫設定
+    從 .env 檔案載入資料庫設定 (每個 schema 只讀取一次)
     
     Args:
         schema: 指定的資料庫名稱，如果為 None 則使用 .env 中的 DB_NAME
         
     Returns:
-        包含資料庫連線資訊的字典
+        包含資料庫連線資訊的唯讀字典 (結果會被快取共用，故不可修改)
         
     Raises:
         ValueError: 當必要的環境變數缺失時
@@ -30,24 +34,31 @@ def default_dbconfig(schema: Optional[str] = None) -> Dict[str, Any]:
     if missing_vars:
         raise ValueError(f"缺少必要的環境變數: {', '.join(missing_vars)}")
     
-    return {
+    return MappingProxyType({
         'user': config.get('DB_USER'),
         'password': config.get('DB_PASSWORD'),
         'host': config.get('DB_HOST'),
         'port': int(config.get('DB_PORT')),  # 確保 port 是整數
         'database': config.get('DB_NAME') if schema is None else schema
-    }
+    })
 
-def default_engine(schema: Optional[str] = None):
+def default_engine(schema: Optional[str] = None, max_workers: Optional[int] = None):
     """
-    建立 SQLAlchemy 資料庫引擎
+    建立 SQLAlchemy 資料庫引擎 (每個 schema 及執行緒數量共用同一個引擎及其連線池)
     
     Args:
         schema: 指定的資料庫名稱
+        max_workers: 會同時使用引擎的執行緒數量，連線池依此設定，None 則使用 Config.MAX_WORKERS
         
     Returns:
         SQLAlchemy Engine 物件
     """
+    # 先正規化，default_engine() 與 default_engine(max_workers=Config.MAX_WORKERS) 才會共用同一個引擎
+    return _engine(schema, Config.MAX_WORKERS if max_workers is None else max_workers)
+
+
+@lru_cache(maxsize=8)
+def _engine(schema: Optional[str], max_workers: int):
     from sqlalchemy import create_engine
     
     db_config = default_dbconfig(schema)
@@ -56,12 +67,15 @@ def default_engine(schema: Optional[str] = None):
     connection_string = (
         f"mysql+pymysql://{db_config['user']}:{db_config['password']}"
         f"@{db_config['host']}:{db_config['port']}/{db_config['database']}"
+        "?charset=utf8mb4"  # 中文欄位名稱及資料需使用 utf8mb4
     )
     
     return create_engine(
         connection_string,
         pool_pre_ping=True,
         pool_recycle=3600,  # 自動回收超時連線
+        pool_size=max(5, max_workers),  # compute_all 的每個執行緒都能拿到獨立連線
+        max_overflow=max_workers,
         echo=False  # 設為 True 可以看到 SQL 語句
     )
 
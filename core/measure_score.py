@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-import json
-from typing import Union, Any, Dict, Callable
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Union, Any, Dict, Callable, List, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
+from .config import Config
 from .data_fetcher import  DateLike
 from .dbconfig import default_engine
-from .measure_value import MeasureValue
+from .cache import load_measure_profile
+from .csv_writer import write_csv
+from .measure_value import MeasureValue, assemble_series, downsample
+
+logger = logging.getLogger(__name__)
 
 
 class MeasureScore:
@@ -15,17 +23,34 @@ class MeasureScore:
     according to the settings in measure_profile.json, generating a DataFrame or CSV of measure_score.
     """
 
-    def __init__(self, profile_path: Union[str, Path], encoding: str = "utf-8-sig", engine=None):
+    def __init__(self, profile_path: Union[str, Path], encoding: str = "utf-8-sig", engine=None,
+                 max_workers: Optional[int] = None):
         self.profile_path = Path(profile_path)
         self.encoding = encoding
-        self.engine = engine or default_engine()
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        # Concurrent fetches in compute_all; the default engine's pool is sized to match
+        self.max_workers = Config.MAX_WORKERS if max_workers is None else max_workers
+        self.engine = engine or default_engine(max_workers=self.max_workers)
         self.measure_profile: Dict[str, Dict[str, Any]] = self._load_measure_profile()
-        self.mv = MeasureValue(profile_path, encoding, engine or default_engine())
+        self.mv = MeasureValue(profile_path, encoding, self.engine, measure_profile=self.measure_profile,
+                               max_workers=self.max_workers)
+        self._func_map: Dict[str, Callable[..., pd.Series]] = self._build_func_map()
 
     def _load_measure_profile(self) -> Dict[str, Dict[str, Any]]:
         """Load measure profile from JSON file"""
-        with self.profile_path.open("r", encoding=self.encoding) as f:
-            return json.load(f)
+        return load_measure_profile(self.profile_path, self.encoding)
+
+    def _build_func_map(self) -> Dict[str, Callable[..., pd.Series]]:
+        """Resolve every valid profile entry to its scoring callable once"""
+        func_map = {}
+        for measure_id in self.measure_profile:
+            try:
+                func_map[measure_id] = self._get_measure_func(measure_id)
+            except (KeyError, TypeError, AttributeError):
+                # Left out here; compute_one resolves it again and raises the specific error
+                pass
+        return func_map
 
     def _get_measure_func(self, measure_id: str) -> Callable[..., pd.Series]:
         """Get the method corresponding to the measure_id"""
@@ -34,6 +59,12 @@ class MeasureScore:
             raise KeyError(f"measure_id {measure_id} does not exist in measure_profile.json")
 
         func_name = cfg.get("func_score")
+        if self._is_sql_scored(cfg):
+            # Scored by the database; only the 0/3/4 column is transferred
+            return partial(self._score_via_sql, measure_id)
+        if func_name is None and "thresholds" in cfg:
+            # Table-driven: fetch with the measure's func_value and bin by its profile thresholds
+            return partial(self._score_by_profile, measure_id)
         if not isinstance(func_name, str):
             raise TypeError(f"measure_id {measure_id} 'func_score' setting must be a string (method name)")
 
@@ -52,11 +83,11 @@ class MeasureScore:
         end_date: DateLike,
     ) -> pd.Series:
         """Compute a single measure score"""
-        func = self._get_measure_func(measure_id)
+        func = self._func_map.get(measure_id) or self._get_measure_func(measure_id)
         series = func(start_date, end_date)
 
         if not isinstance(series, pd.Series):
-            raise TypeError(f"{measure_id} function {func.__name__} did not return pd.Series")
+            raise TypeError(f"{measure_id} function {getattr(func, '__name__', measure_id)} did not return pd.Series")
 
         series.name = measure_id
         return series
@@ -69,27 +100,40 @@ class MeasureScore:
         frequency: str = "D"
     ) -> pd.DataFrame:
         """Compute all measure scores in the profile"""
+        measure_ids = [mid for mid, cfg in self.measure_profile.items() if "func_score" in cfg or "thresholds" in cfg]
         series_dict: Dict[str, pd.Series] = {}
-
-        for measure_id in self.measure_profile.keys():
-            # Check if the measure has func_score
-            if "func_score" not in self.measure_profile[measure_id]:
-                continue
-                 
-            print(f"Computing {measure_id} ...")
-            try:
-                s = self.compute_one(measure_id, start_date, end_date)
-                series_dict[measure_id] = s
-            except Exception as e:
-                print(f"Error computing {measure_id}: {e}")
+        # Parse the range once; every fetch below then only formats a ready Timestamp
+        start_date, end_date = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        # Measures scored in SQL are batched into one CASE WHEN query per table instead of reading values
+        sql_ids = [mid for mid in measure_ids if self._is_sql_scored(self.measure_profile[mid])]
+        self.mv.prefetch([mid for mid in measure_ids if mid not in sql_ids], start_date, end_date)
+        self.mv.prefetch_scores([self._sql_spec(mid) for mid in sql_ids], start_date, end_date)
+
+        # Measures are independent, I/O-bound fetches, so run them concurrently
+        # No more threads than measures (and at least one, so an empty profile still works)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(measure_ids)))) as executor:
+            futures = {}
+            for measure_id in measure_ids:
+                logger.debug("Computing %s ...", measure_id)
+                futures[measure_id] = executor.submit(self.compute_one, measure_id, start_date, end_date)
+
+            # Collect in profile order so the column order of the result stays stable
+            for measure_id, future in futures.items():
+                try:
+                    series_dict[measure_id] = future.result()
+                except Exception as e:
+                    print(f"Error computing {measure_id}: {e}")
+        # One summary line instead of a stdout write per measure from the submit loop
+        print(f"Computed {len(series_dict)}/{len(measure_ids)} measures")
 
         if not series_dict:
             return pd.DataFrame()
 
-        df = pd.concat(series_dict.values(), axis=1, join=how).ffill()#為了解決資料間頻率不同的問題
-        df = df.groupby(df.index.to_period(frequency)).tail(1)
-        df.index = df.index.to_period(frequency).to_timestamp(how='end')
-        
+        df = assemble_series(series_dict, how) #為了解決資料間頻率不同的問題
+        df = downsample(df, frequency)
+        # Scores are small integers; nullable Int8 keeps the outer-join gaps as <NA> at 1/8 the size of float64
+        df = df.astype("Int8")
+
         return df
 
     def to_csv(
@@ -102,7 +146,7 @@ class MeasureScore:
         csv_encoding: str = "utf-8-sig",
         date_format: str = "%Y/%m/%d",
     ) -> pd.DataFrame:
-        """Compute all and save to CSV"""
+        """Compute all and save to CSV; returns the computed frame"""
         df = self.compute_all(
             start_date=start_date,
             end_date=end_date,
@@ -110,18 +154,60 @@ class MeasureScore:
             frequency=frequency
         )
 
-        df_out = df.copy()
-        if isinstance(df_out.index, pd.DatetimeIndex):
-            df_out.insert(0, "Date", df_out.index.strftime(date_format))
-        else:
-            df_out.insert(0, "Date", df_out.index.astype(str))
-
-        df_out.reset_index(drop=True, inplace=True)
-
+        # The Date column is added on the Arrow side, so df is written without being copied or modified
         output_path = Path(output_path)
-        df_out.to_csv(output_path, index=False, encoding=csv_encoding)
+        write_csv(df, output_path, encoding=csv_encoding, index_label="Date", date_format=date_format)
         print(f"Saved to {output_path}")
-        return df_out
+        return df
+
+    # =========================
+    #   Helper Methods
+    # =========================
+    @staticmethod
+    def _apply_thresholds(s: pd.Series, thresholds: List[float], scores: List[int], direction: str = "gt") -> pd.Series:
+        """
+        Bin s into len(thresholds) + 1 buckets and map each bucket to scores.
+
+        With direction 'gt' a value scores into the next bucket only when it is strictly above
+        a threshold; with 'lt' only when it is at or above it (i.e. 'x < threshold' rules).
+        NaN scores 0. Scores are small integers, so the result is int8.
+        """
+        values = s.to_numpy(dtype=float)
+        side = "left" if direction == "gt" else "right"
+        idx = np.searchsorted(np.asarray(thresholds, dtype=float), values, side=side)
+        result = np.where(np.isnan(values), 0, np.asarray(scores)[idx]).astype(np.int8)
+        return pd.Series(result, index=s.index, name=s.name)
+
+    def _score_from_profile(self, s: pd.Series, measure_id: str) -> pd.Series:
+        """Score s with the thresholds / scores / direction configured for measure_id"""
+        cfg = self.measure_profile[measure_id]
+        return self._apply_thresholds(s, cfg["thresholds"], cfg["scores"], cfg.get("direction", "gt"))
+
+    @staticmethod
+    def _field_key(cfg: Dict[str, Any]) -> Optional[str]:
+        """MeasureValue._FIELD_MAP key of a profile entry, e.g. 'fetch_taiex_pe' -> 'taiex_pe'"""
+        func_name = cfg.get("func_value")
+        return func_name[len("fetch_"):] if isinstance(func_name, str) and func_name.startswith("fetch_") else None
+
+    def _is_sql_scored(self, cfg: Dict[str, Any]) -> bool:
+        """True for a "score_sql" entry whose values come from a daily TA table"""
+        return bool(cfg.get("score_sql")) and self._field_key(cfg) in self.mv._FIELD_MAP
+
+    def _sql_spec(self, measure_id: str) -> Tuple[str, List[float], List[int], str]:
+        """(key, thresholds, scores, direction) of a "score_sql" measure for MeasureValue's SQL scoring"""
+        cfg = self.measure_profile[measure_id]
+        return self._field_key(cfg), cfg["thresholds"], cfg["scores"], cfg.get("direction", "gt")
+
+    def _score_via_sql(self, measure_id: str, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Score a daily TA measure flagged with "score_sql" in the database"""
+        s = self.mv._fetch_score_sql(*self._sql_spec(measure_id), start_date, end_date)
+        return s.astype(np.int8)
+
+    def _score_by_profile(self, measure_id: str, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Score a measure that has thresholds but no calc_score_* method of its own"""
+        fetch = self.mv._func_map.get(measure_id) or self.mv._get_measure_func(measure_id)
+        s = fetch(start_date, end_date)
+        return self._score_from_profile(s, measure_id)
 
     # ==============================================
     #   Score Calculation Methods
@@ -129,189 +215,189 @@ class MeasureScore:
     def calc_score_taiwan_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_leading_indicator : 台灣領先指標"""
         s = self.mv.fetch_taiwan_leading_indicator(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 105.954 else (3 if x > 87.392 else 0))
+        return self._score_from_profile(s, "taiwan_leading_indicator")
     
     def calc_score_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """pmi_manufacturing_index : PMI製造業指數"""
         s = self.mv.fetch_pmi_manufacturing_index(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 52.6 else (3 if x > 47.3 else 0))
+        return self._score_from_profile(s, "pmi_manufacturing_index")
 
     def calc_score_taiwan_export_orders(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_export_orders : 台灣外銷訂單"""
         s = self.mv.fetch_taiwan_export_orders(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 37625.2 else (3 if x > 31362.6 else 0))
+        return self._score_from_profile(s, "taiwan_export_orders")
     
     def calc_score_taiwan_industrial_production(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_industrial_production : 台灣工業生產指數"""
         s = self.mv.fetch_taiwan_industrial_production(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 104.63 else (3 if x > 89.39 else 0))
+        return self._score_from_profile(s, "taiwan_industrial_production")
 
     def calc_score_taiwan_trade_balance(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_trade_balance : 台灣貿易收支"""
         s = self.mv.fetch_taiwan_trade_balance(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 3.49 else (3 if x > 1.52 else 0))
+        return self._score_from_profile(s, "taiwan_trade_balance")
 
     def calc_score_taiwan_retail_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:    
         """台灣零售銷售額_id : 台灣零售銷售額"""
         s = self.mv.fetch_taiwan_retail_sales(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 328.75 else (3 if x > 279.9 else 0))
+        return self._score_from_profile(s, "taiwan_retail_sales")
 
     def calc_score_taiwan_unemployment_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_unemployment_rate : 失業率"""
         s = self.mv.fetch_taiwan_unemployment_rate(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 3.94 else (3 if x < 4.3 else 0))
+        return self._score_from_profile(s, "taiwan_unemployment_rate")
 
     def calc_score_taiwan_cpi(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_cpi : 消費者物價指數"""
         s = self.mv.fetch_taiwan_cpi(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 1.66 else (3 if x > 0.072 else 0))
+        return self._score_from_profile(s, "taiwan_cpi")
 
     def calc_score_taiwan_m1b_m2(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiwan_m1b_m2 : M1B-M2"""
         s = self.mv.fetch_taiwan_m1b_m2(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 0.03 else (3 if x > -0.01 else 0))
+        return self._score_from_profile(s, "taiwan_m1b_m2")
     
     def calc_score_taiex_bias(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_bias : 67日乖離率"""
         s = self.mv.fetch_taiex_bias(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 2.72 else (3 if x > -2.68 else 0))
+        return self._score_from_profile(s, "taiex_bias")
 
     def calc_score_otc_bias(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """OTC 指數乖離率_id : 67日乖離率"""
         s = self.mv.fetch_otc_bias(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 3.0 else (3 if x > -3.94 else 0))
+        return self._score_from_profile(s, "otc_bias")
 
     def calc_score_taiex_macd(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_macd : MACD"""
         s = self.mv.fetch_taiex_macd(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 283.34 else (3 if x > -29.68 else 0))
+        return self._score_from_profile(s, "taiex_macd")
     
     def calc_score_otc_macd(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """OTC MACD_id : MACD"""
         s = self.mv.fetch_otc_macd(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 3.57 else (3 if x > -5.68 else 0))    
+        return self._score_from_profile(s, "otc_macd")
     
     def calc_score_taiex_dif(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_dif : DIF"""
         s = self.mv.fetch_taiex_dif(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 283.34 else (3 if x > -29.68 else 0))
+        return self._score_from_profile(s, "taiex_dif")
     
     def calc_score_taiex_adx(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_adx : ADX"""
         s = self.mv.fetch_taiex_adx(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 19.61 else (3 if x > 12.2 else 0))
+        return self._score_from_profile(s, "taiex_adx")
 
     def calc_score_taiex_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_pe : 本益比"""
         s = self.mv.fetch_taiex_pe(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 13.4 else (3 if x < 15.52 else 0))    
+        return self._score_from_profile(s, "taiex_pe")
 
     def calc_score_tw50_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """tw50_pe : 本益比"""
         s = self.mv.fetch_tw50_pe(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 13.5 else (3 if x < 15.4 else 0))        
+        return self._score_from_profile(s, "tw50_pe")
     
     def calc_score_mid100_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """台灣中型100指數本益比 : 本益比"""
         s = self.mv.fetch_mid100_pe(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 13.8 else (3 if x < 15.7 else 0))
+        return self._score_from_profile(s, "mid100_pe")
 
     def calc_score_highdiv_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """台灣高股息指數本益比 : 本益比"""
         s = self.mv.fetch_highdiv_pe(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 11.8 else (3 if x < 14.34 else 0))    
+        return self._score_from_profile(s, "highdiv_pe")
     
     def calc_score_otc_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """OTC 指數本益比 : 本益比"""
         s = self.mv.fetch_otc_pe(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 17.64 else (3 if x < 22.2 else 0)) 
+        return self._score_from_profile(s, "otc_pe")
     
     def calc_score_taiex_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_pb : 股價淨值比"""
         s = self.mv.fetch_taiex_pb(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 1.63 else (3 if x < 1.76 else 0)) 
+        return self._score_from_profile(s, "taiex_pb")
 
     def calc_score_tw50_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """台灣50指數股價淨值比_id : 股價淨值比"""
         s = self.mv.fetch_tw50_pb(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 1.81 else (3 if x < 1.96 else 0)) 
+        return self._score_from_profile(s, "tw50_pb")
 
     def calc_score_mid100_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """台灣中型100指數股價淨值比_id : 股價淨值比"""
         s = self.mv.fetch_mid100_pb(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 1.36 else (3 if x < 1.55 else 0)) 
+        return self._score_from_profile(s, "mid100_pb")
     
     def calc_score_highdiv_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """台灣高股息指數股價淨值比_id : 股價淨值比"""
         s = self.mv.fetch_highdiv_pb(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 1.44 else (3 if x < 1.84 else 0)) 
+        return self._score_from_profile(s, "highdiv_pb")
     
     def calc_score_otc_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """OTC 指數股價淨值比_id : 股價淨值比"""
         s = self.mv.fetch_otc_pb(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 1.64 else (3 if x < 1.97 else 0))
+        return self._score_from_profile(s, "otc_pb")
     #海外指標
     def calc_score_global_gdp_real_growth_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """global_gdp_real_growth_rate : 實質GDP成長率"""
         s = self.mv.fetch_global_gdp_real_growth_rate(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 4.11 else (3 if x > 1.6 else 0))
+        return self._score_from_profile(s, "global_gdp_real_growth_rate")
     
     def calc_score_us_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_leading_indicator : 美國領先指標"""
         s = self.mv.fetch_us_leading_indicator(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 118.3 else (3 if x > 100.98 else 0))
+        return self._score_from_profile(s, "us_leading_indicator")
     
     def calc_score_us_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_pmi_manufacturing_index : ISM製造業指數"""
         s = self.mv.fetch_us_pmi_manufacturing_index(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 55.06 else (3 if x > 49.82 else 0))
+        return self._score_from_profile(s, "us_pmi_manufacturing_index")
     
     def calc_score_us_durable_goods_orders(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_durable_goods_orders : 美國耐久財訂單"""
         s = self.mv.fetch_us_durable_goods_orders(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 229818 else (3 if x > 194326 else 0))
+        return self._score_from_profile(s, "us_durable_goods_orders")
     
     def calc_score_us_retail_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_retail_sales : 美國零售銷售"""
         s = self.mv.fetch_us_retail_sales(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 435.2128 else (3 if x > 360.208 else 0))
+        return self._score_from_profile(s, "us_retail_sales")
     
     def calc_score_us_employment_mom(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_employment_mom : 美國就業數據(MOM)"""
         s = self.mv.fetch_us_employment_mom(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 225.2 else (3 if x > -68 else 0))
+        return self._score_from_profile(s, "us_employment_mom")
     
     def calc_score_us_unemployment_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_unemployment_rate : 美國失業率"""
         s = self.mv.fetch_us_unemployment_rate(start_date, end_date)
-        return s.apply(lambda x: 4 if x < 5 else (3 if x < 8.3 else 0))
+        return self._score_from_profile(s, "us_unemployment_rate")
     
     def calc_score_us_cpi_yoy(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_cpi_yoy : 美國CPI年增率"""
         s = self.mv.fetch_us_cpi_yoy(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 0.02 else (3 if x > 0.01 else 0))
+        return self._score_from_profile(s, "us_cpi_yoy")
     
     def calc_score_us_existing_home_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_existing_home_sales : 成屋銷售量"""
         s = self.mv.fetch_us_existing_home_sales(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 5.09 else (3 if x > 4.17 else 0))
+        return self._score_from_profile(s, "us_existing_home_sales")
     
     def calc_score_us_m1_m2(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_m1_m2 : 美國M1-M2"""
         s = self.mv.fetch_us_m1_m2(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 0.0506977982101653 else (3 if x > 0.00914105740191716 else 0))
+        return self._score_from_profile(s, "us_m1_m2")
     
     def calc_score_eu_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """eu_leading_indicator : 歐洲領先指標"""
         s = self.mv.fetch_eu_leading_indicator(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 100 else (3 if x > 95 else 0))
+        return self._score_from_profile(s, "eu_leading_indicator")
     
     def calc_score_eu_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """eu_pmi_manufacturing_index : 歐洲PMI製造業指數"""
         s = self.mv.fetch_eu_pmi_manufacturing_index(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 51.52 else (3 if x > 49 else 0))
+        return self._score_from_profile(s, "eu_pmi_manufacturing_index")
     
     def calc_score_eu_economic_sentiment(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """eu_economic_sentiment : 歐洲經濟景氣指數"""
         s = self.mv.fetch_eu_economic_sentiment(start_date, end_date)
-        return s.apply(lambda x: 4 if x > 0.4 else (3 if x > -0.87 else 0))
\ No newline at end of file
+        return self._score_from_profile(s, "eu_economic_sentiment")
\ No newline at end of file
@@ -1,31 +1,151 @@
 from __future__ import annotations
 
+import logging
 import sys, os
-import json
-from typing import Union, Any, Dict, Callable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Union, Any, Dict, Callable, List, Mapping, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
+from sqlalchemy import String, bindparam, text
+from sqlalchemy.sql.elements import TextClause
 from .dbconfig import default_engine
+from .cache import cache_dir, load_frame, load_measure_profile, save_frame
+from .csv_writer import write_csv
 from .config import Config
-from .data_fetcher import DataFetcher, DateLike
+from .data_fetcher import DataFetcher, DateLike, EmptyDataError, format_date
 import akshare as ak
 
+logger = logging.getLogger(__name__)
+
+
+def assemble_series(series_dict: Dict[str, pd.Series], how: str = "outer") -> pd.DataFrame:
+    """
+    Align the measure series on one index and forward-fill the gaps.
+
+    Equivalent to pd.concat(series_dict.values(), axis=1, join=how).ffill(), but for the
+    default outer join every series is scattered into one preallocated float64 buffer,
+    skipping concat's per-series alignment and block consolidation.
+    """
+    if how != "outer":
+        return pd.concat(series_dict.values(), axis=1, join=how).ffill()
+
+    indexes = [s.index for s in series_dict.values()]
+    union = indexes[0].append(indexes[1:]).unique().sort_values()
+    names = {idx.name for idx in indexes}
+    union.name = names.pop() if len(names) == 1 else None
+
+    buffer = np.full((len(union), len(series_dict)), np.nan)
+    for i, s in enumerate(series_dict.values()):
+        buffer[union.get_indexer(s.index), i] = s.to_numpy(dtype=float, na_value=np.nan)
+
+    return pd.DataFrame(buffer, index=union, columns=list(series_dict)).ffill()
+
+
+def downsample(df: pd.DataFrame, frequency: str) -> pd.DataFrame:
+    """Keep the last value per frequency period, stamped at the end of the period"""
+    if frequency == "D" and df.index.is_unique and (df.index == df.index.normalize()).all():
+        # Already one row per day: the groupby would return df unchanged, only the stamps move
+        return df.set_axis(df.index + pd.Timedelta(days=1) - pd.Timedelta(1, "ns"))
+
+    # Last row per period via one Cython groupby; the index is converted to periods only once
+    df = df.groupby(df.index.to_period(frequency)).last()
+    df.index = df.index.to_timestamp(how='end')
+    return df
+
+
 class MeasureValue:
     """
     Responsible for calling the corresponding measure method in this class 
     according to the settings in measure_profile.json, generating a DataFrame or CSV of measure_value.
     """
 
-    def __init__(self, profile_path: Union[str, Path], encoding: str = "utf-8-sig", engine=None):
+    # Daily TA measures: key -> (table, 股票代號, field)
+    _FIELD_MAP: Dict[str, Tuple[str, str, str]] = {
+        "taiex_bias": ("md_cm_ta_dailystatistics", "TWA00", "乖離率60日"),
+        "otc_bias": ("md_cm_ta_dailystatistics", "TWC00", "乖離率60日"),
+        "taiex_macd": ("md_cm_ta_dailystatistics", "TWA00", "月MACD"),
+        "otc_macd": ("md_cm_ta_dailystatistics", "TWC00", "月MACD"),
+        "taiex_dif": ("md_cm_ta_dailystatistics", "TWA00", "月DIF"),
+        "taiex_adx": ("md_cm_ta_dailystatistics", "TWA00", "月ADX14"),
+        "taiex_pe": ("md_cm_ta_dailyquotes", "TWA00", "本益比"),
+        "tw50_pe": ("md_cm_ta_dailyquotes", "TWA50", "本益比"),
+        "mid100_pe": ("md_cm_ta_dailyquotes", "TWA51", "本益比"),
+        "highdiv_pe": ("md_cm_ta_dailyquotes", "TWA54", "本益比"),
+        "otc_pe": ("md_cm_ta_dailyquotes", "TWC00", "本益比"),
+        "taiex_pb": ("md_cm_ta_dailyquotes", "TWA00", "股價淨值比"),
+        "tw50_pb": ("md_cm_ta_dailyquotes", "TWA50", "股價淨值比"),
+        "mid100_pb": ("md_cm_ta_dailyquotes", "TWA51", "股價淨值比"),
+        "highdiv_pb": ("md_cm_ta_dailyquotes", "TWA54", "股價淨值比"),
+        "otc_pb": ("md_cm_ta_dailyquotes", "TWC00", "股價淨值比"),
+    }
+
+    # Monthly md_cm_eco_economics measures: key -> (代號, divisor applied to 數值)
+    _ECO_MAP: Dict[str, Tuple[str, int]] = {
+        "taiwan_leading_indicator": ("TWB20", 1),
+        "pmi_manufacturing_index": ("70100", 1),
+        "taiwan_export_orders": ("TWG01", 1),
+        "taiwan_industrial_production": ("18860", 1),
+        "taiwan_trade_balance": ("18700", 1000),
+        "taiwan_retail_sales": ("44220", 1000),
+        "taiwan_unemployment_rate": ("19400", 1),
+        "taiwan_cpi": ("18100", 1),
+        "global_gdp_real_growth_rate": ("IMF40", 1),
+        "us_leading_indicator": ("USA55", 1),
+        "us_pmi_manufacturing_index": ("USA04", 1),
+        "us_durable_goods_orders": ("USA85", 1),
+        "us_retail_sales": ("USA87", 1000),
+        "us_employment_mom": ("USA24", 1),
+        "us_unemployment_rate": ("USA20", 1),
+        "us_cpi_yoy": ("USA39", 1),
+        "us_existing_home_sales": ("USA33", 1),
+        "eu_leading_indicator": ("EUR00", 1),
+        "eu_pmi_manufacturing_index": ("EUR06", 1),
+    }
+
+    # Monthly spreads of two md_cm_eco_economics series: key -> (代號, 代號 subtracted from it)
+    _ECO_SPREAD_MAP: Dict[str, Tuple[str, str]] = {
+        "taiwan_m1b_m2": ("12301", "12501"),
+        "us_m1_m2": ("USA57", "USA58"),
+    }
+
+    def __init__(self, profile_path: Union[str, Path], encoding: str = "utf-8-sig", engine=None,
+                 measure_profile: Optional[Dict[str, Dict[str, Any]]] = None,
+                 max_workers: Optional[int] = None):
         self.profile_path = Path(profile_path)
         self.encoding = encoding
-        self.engine = engine or default_engine()
-        self.measure_profile: Dict[str, Dict[str, Any]] = self._load_measure_profile()
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        # Concurrent fetches in compute_all; the default engine's pool is sized to match
+        self.max_workers = Config.MAX_WORKERS if max_workers is None else max_workers
+        self.engine = engine or default_engine(max_workers=self.max_workers)
+        # An already parsed profile (e.g. MeasureScore's) can be handed in to skip the load
+        self.measure_profile: Dict[str, Dict[str, Any]] = (
+            measure_profile if measure_profile is not None else self._load_measure_profile()
+        )
+        # (table, 股票代號) -> (start, end, frame of the prefetched fields), see prefetch()
+        self._cache: Dict[Tuple[str, str], Tuple[str, str, pd.DataFrame]] = {}
+        # (key, thresholds, scores, direction) -> (start, end, SQL-scored series), see prefetch_scores()
+        self._score_cache: Dict[Tuple[str, tuple, tuple, str], Tuple[str, str, pd.Series]] = {}
+        self._func_map: Dict[str, Callable[..., pd.Series]] = self._build_func_map()
 
     def _load_measure_profile(self) -> Dict[str, Dict[str, Any]]:
         """Load measure profile from JSON file"""
-        with self.profile_path.open("r", encoding=self.encoding) as f:
-            return json.load(f)
+        return load_measure_profile(self.profile_path, self.encoding)
+
+    def _build_func_map(self) -> Dict[str, Callable[..., pd.Series]]:
+        """Resolve every valid profile entry to its bound fetch method once"""
+        func_map = {}
+        for measure_id in self.measure_profile:
+            try:
+                func_map[measure_id] = self._get_measure_func(measure_id)
+            except (KeyError, TypeError, AttributeError):
+                # Left out here; compute_one resolves it again and raises the specific error
+                pass
+        return func_map
 
     def _get_measure_func(self, measure_id: str) -> Callable[..., pd.Series]:
         """Get the method corresponding to the measure_id"""
@@ -52,16 +172,17 @@ class MeasureValue:
         end_date: DateLike,
     ) -> pd.Series:
         """Compute a single measure"""
-        func = self._get_measure_func(measure_id)
-        series = func(start_date, end_date)
+        return self._compute_one(measure_id, start_date, end_date, self._load_history(measure_id, start_date))
 
-        if not isinstance(series, pd.Series):
-            raise TypeError(f"{measure_id} function {func.__name__} did not return pd.Series")
+    def _compute_one(self, measure_id: str, start_date: DateLike, end_date: DateLike,
+                     cached: Optional[Tuple[pd.Series, float, pd.Timestamp]]) -> pd.Series:
+        """compute_one() on an already loaded history (see _load_history())"""
+        func = self._func_map.get(measure_id) or self._get_measure_func(measure_id)
+        series = self._fetch_with_history(measure_id, func, start_date, end_date, cached)
 
-        series.name = measure_id
-        #小數點後兩位
-        series = series.round(2)
-        return series
+        #小數點後兩位 (a new float64 Series: the fetched one may be a view of self._cache, so it is not modified)
+        values = np.round(series.to_numpy(dtype=float, na_value=np.nan), 2)
+        return pd.Series(values, index=series.index, name=measure_id)
 
     def compute_all(
         self,
@@ -71,28 +192,41 @@ class MeasureValue:
         frequency: str = "D"
     ) -> pd.DataFrame:
         """Compute all measures in the profile"""
+        measure_ids = [mid for mid, cfg in self.measure_profile.items() if "func_value" in cfg]
         series_dict: Dict[str, pd.Series] = {}
-
-        for measure_id in self.measure_profile.keys():
-            # Check if the measure has func_value
-            if "func_value" not in self.measure_profile[measure_id]:
-                continue
-                 
-            print(f"Computing {measure_id} ...")
-            try:
-                s = self.compute_one(measure_id, start_date, end_date)
-                series_dict[measure_id] = s
-            except Exception as e:
-                print(f"Error computing {measure_id}: {e}")
+        # Parse the range once; every fetch below then only formats a ready Timestamp
+        start_date, end_date = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        # Measures with a cached history only fetch their tail, so prefetch from the earliest gap
+        # Each history is read once here and handed to its compute, so both see the same file
+        histories = {mid: self._load_history(mid, start_date) for mid in measure_ids}
+        gaps = {mid: self._history_gap_start(histories[mid], start_date, end_date) for mid in measure_ids}
+        pending = [mid for mid, gap in gaps.items() if gap is not None]
+        self.prefetch(pending, min((gaps[mid] for mid in pending), default=start_date), end_date)
+
+        # Measures are independent, I/O-bound fetches, so run them concurrently
+        # No more threads than measures (and at least one, so an empty profile still works)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(measure_ids)))) as executor:
+            futures = {}
+            for measure_id in measure_ids:
+                logger.debug("Computing %s ...", measure_id)
+                futures[measure_id] = executor.submit(
+                    self._compute_one, measure_id, start_date, end_date, histories[measure_id]
+                )
+
+            # Collect in profile order so the column order of the result stays stable
+            for measure_id, future in futures.items():
+                try:
+                    series_dict[measure_id] = future.result()
+                except Exception as e:
+                    print(f"Error computing {measure_id}: {e}")
+        # One summary line instead of a stdout write per measure from the submit loop
+        print(f"Computed {len(series_dict)}/{len(measure_ids)} measures")
 
         if not series_dict:
             return pd.DataFrame()
 
-        df = pd.concat(series_dict.values(), axis=1, join=how).ffill() #為了解決資料間頻率不同的問題
-        df = df.groupby(df.index.to_period(frequency)).tail(1)
-        df.index = df.index.to_period(frequency).to_timestamp(how='end')
-        
-        return df
+        df = assemble_series(series_dict, how) #為了解決資料間頻率不同的問題
+        return downsample(df, frequency)
 
     def to_csv(
         self,
@@ -104,7 +238,7 @@ class MeasureValue:
         csv_encoding: str = "utf-8-sig",
         date_format: str = "%Y/%m/%d",
     ) -> pd.DataFrame:
-        """Compute all and save to CSV"""
+        """Compute all and save to CSV; returns the computed frame"""
         df = self.compute_all(
             start_date=start_date,
             end_date=end_date,
@@ -112,22 +246,112 @@ class MeasureValue:
             frequency=frequency
         )
 
-        df_out = df.copy()
-        if isinstance(df_out.index, pd.DatetimeIndex):
-            df_out.insert(0, "Date", df_out.index.strftime(date_format))
-        else:
-            df_out.insert(0, "Date", df_out.index.astype(str))
-
-        df_out.reset_index(drop=True, inplace=True)
-
+        # The Date column is added on the Arrow side, so df is written without being copied or modified
         output_path = Path(output_path)
-        df_out.to_csv(output_path, index=False, encoding=csv_encoding)
+        write_csv(df, output_path, encoding=csv_encoding, index_label="Date", date_format=date_format)
         print(f"Saved to {output_path}")
-        return df_out
+        return df
 
     # =========================
     #   Helper Methods
     # =========================
+    def _fetch_measure(self, measure_id: str, func: Callable[..., pd.Series],
+                       start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Call a measure's fetch method and check that it returned a Series"""
+        series = func(start_date, end_date)
+        if not isinstance(series, pd.Series):
+            raise TypeError(f"{measure_id} function {getattr(func, '__name__', measure_id)} did not return pd.Series")
+        return series
+
+    def _measure_key(self, measure_id: str) -> Optional[str]:
+        """Key of measure_id in the _*_MAP tables: its func_value without the 'fetch_' prefix"""
+        func_name = self.measure_profile.get(measure_id, {}).get("func_value")
+        return func_name[len("fetch_"):] if isinstance(func_name, str) else None
+
+    def _history_floor(self, measure_id: str, start_date: DateLike) -> pd.Timestamp:
+        """Earliest row date a fetch from start_date returns: economics rows are dated the 1st of the month"""
+        start = pd.Timestamp(start_date)
+        key = self._measure_key(measure_id)
+        if key in self._ECO_MAP or key in self._ECO_SPREAD_MAP:
+            return start.to_period("M").start_time
+        return start.normalize()
+
+    def _history_path(self, measure_id: str) -> Path:
+        """Parquet file holding measure_id's history on self.engine, see _fetch_with_history()"""
+        return cache_dir("measure", self.engine.url) / f"{measure_id}.parquet"
+
+    def _load_history(self, measure_id: str,
+                      start_date: DateLike) -> Optional[Tuple[pd.Series, float, pd.Timestamp]]:
+        """
+        (cached history, time of its last full fetch, first date it covers), None when missing,
+        due for a full refetch, written for another func_value or not reaching back to start_date
+        """
+        frame = load_frame(self._history_path(measure_id), ttl=0)
+        if frame is None or frame.empty:
+            return None
+        attrs = frame.attrs
+        refreshed = attrs.get("refreshed")
+        if refreshed is None or time.time() - refreshed > Config.MEASURE_CACHE_TTL:
+            return None
+        if attrs.get("func_value") != self.measure_profile.get(measure_id, {}).get("func_value"):
+            return None
+        covered = pd.Timestamp(attrs.get("start"))
+        if pd.isna(covered) or covered > self._history_floor(measure_id, start_date):
+            return None
+        return frame["value"], refreshed, covered
+
+    @staticmethod
+    def _history_gap_start(cached: Optional[Tuple[pd.Series, float, pd.Timestamp]],
+                           start_date: DateLike, end_date: DateLike) -> Optional[pd.Timestamp]:
+        """First date a compute on the cached history will fetch; None when it already reaches end_date"""
+        if cached is None:
+            return pd.Timestamp(start_date)
+        last = cached[0].index.max()
+        return last if last < pd.Timestamp(end_date) else None
+
+    def _save_history(self, measure_id: str, series: pd.Series, refreshed: float, covered: pd.Timestamp) -> None:
+        frame = series.to_frame("value")
+        # DataFrame.attrs round-trip through Parquet from pandas 2.1 on, hence the pandas>=2.1 requirement
+        frame.attrs.update({
+            "refreshed": refreshed,
+            "start": covered.isoformat(),
+            "func_value": self.measure_profile.get(measure_id, {}).get("func_value"),
+        })
+        save_frame(self._history_path(measure_id), frame)
+
+    def _fetch_with_history(self, measure_id: str, func: Callable[..., pd.Series],
+                            start_date: DateLike, end_date: DateLike,
+                            cached: Optional[Tuple[pd.Series, float, pd.Timestamp]]) -> pd.Series:
+        """
+        Fetch measure_id through its Parquet history (cached, from _load_history()): once cached,
+        only the rows from the last cached date onwards are fetched (that date again, in case it
+        was revised) and merged over the cached ones. There is one history per measure and
+        engine, sliced to the requested range; each is fetched in full again every
+        Config.MEASURE_CACHE_TTL seconds, or when a range starts before it.
+        """
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        if cached is None:
+            series = self._fetch_measure(measure_id, func, start, end)
+            self._save_history(measure_id, series, time.time(), self._history_floor(measure_id, start))
+            return series
+
+        history, refreshed, covered = cached
+        last = history.index.max()
+        if last < end:
+            try:
+                fresh = self._fetch_measure(measure_id, func, last, end)
+            except EmptyDataError:
+                # Nothing new since the last cached date; any other error reaches compute_all's report
+                fresh = None
+            if fresh is not None:
+                history = pd.concat([history[history.index < last], fresh])
+                self._save_history(measure_id, history, refreshed, covered)
+
+        series = history[(history.index >= self._history_floor(measure_id, start)) & (history.index <= end)]
+        if series.empty:
+            raise EmptyDataError(f"{measure_id} has no data between {start.date()} and {end.date()}")
+        return series
+
     def fetch_data_from_api(
         self,
         stock_id: str,
@@ -140,1015 +364,490 @@ class MeasureValue:
     
     def fetch_data_from_db(
         self,
-        field: str,
-        query: str,
+        field: Union[str, List[str]],
+        query: Union[str, TextClause],
         engine,
         params: Dict[str, Any] = None,
-    ) -> pd.Series:
+    ) -> Union[pd.Series, pd.DataFrame]:
         """Fetch data from database using DataFetcher utility"""
         return DataFetcher.fetch_from_db(field, query, engine, params)
 
-    # ==============================================
-    #   Individual Measure Methods
-    # ==============================================
-    def fetch_taiwan_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """台灣領先指標 : 台灣景氣領先指標"""
-        stock_id = 'TWB20'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _ta_query(table: str, fields: Tuple[str, ...]) -> TextClause:
+        """SELECT of daily TA fields, compiled into a TextClause once per (table, fields)"""
+        return text(f"""
+            SELECT 日期, {", ".join(fields)}
+            FROM `{table}`
+            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
+            ORDER BY 日期 asc
+        """)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _ta_batch_query(table: str, fields: Tuple[str, ...]) -> TextClause:
+        """SELECT of daily TA fields for a list of 股票代號 (expanded into an IN list)"""
+        return text(f"""
+            SELECT 日期, 股票代號, {", ".join(fields)}
+            FROM `{table}`
+            WHERE 股票代號 IN :tickers AND 日期 BETWEEN :start AND :end
+            ORDER BY 日期 asc
+        """).bindparams(bindparam("tickers", expanding=True, type_=String))
 
-        sql = f"""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _eco_query(field: str) -> TextClause:
+        """SELECT of one monthly md_cm_eco_economics field, compiled into a TextClause once per field"""
+        return text(f"""
             SELECT CONCAT(年月,'01') as 日期, {field}
             FROM `md_cm_eco_economics`
             WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
             ORDER BY 年月 asc
+        """)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _eco_batch_query(field: str) -> TextClause:
+        """SELECT of one md_cm_eco_economics field for a list of 代號 (expanded into an IN list)"""
+        return text(f"""
+            SELECT CONCAT(年月,'01') as 日期, 代號, {field}
+            FROM `md_cm_eco_economics`
+            WHERE 代號 IN :tickers AND 年月 BETWEEN :start AND :end
+            ORDER BY 年月 asc
+        """).bindparams(bindparam("tickers", expanding=True, type_=String))
+
+    def prefetch(self, measure_ids: List[str], start_date: DateLike, end_date: DateLike) -> None:
         """
-        params={
-                "field": field,
-                "ticker": stock_id,
+        Load every daily TA field used by measure_ids with one query per table (all 股票代號 in
+        one IN list), and every economics series with one query over all 代號, so the
+        per-measure fetches in compute_all are served from self._cache.
+        """
+        start_str = format_date(start_date, '%Y-%m-%d')
+        end_str = format_date(end_date, '%Y-%m-%d')
+
+        # table -> (股票代號 list, field list), both in profile order
+        groups: Dict[str, Tuple[List[str], List[str]]] = {}
+        eco_ids: List[str] = []
+        for measure_id in measure_ids:
+            key = self._measure_key(measure_id)
+            if key in self._FIELD_MAP:
+                table, stock_id, field = self._FIELD_MAP[key]
+                stock_ids, fields = groups.setdefault(table, ([], []))
+                if stock_id not in stock_ids:
+                    stock_ids.append(stock_id)
+                if field not in fields:
+                    fields.append(field)
+            elif key in self._ECO_MAP or key in self._ECO_SPREAD_MAP:
+                tickers = self._ECO_SPREAD_MAP[key] if key in self._ECO_SPREAD_MAP else self._ECO_MAP[key][:1]
+                eco_ids.extend(stock_id for stock_id in tickers if stock_id not in eco_ids)
+
+        self._cache.clear()
+        for table, (stock_ids, fields) in groups.items():
+            sql = self._ta_batch_query(table, tuple(fields))
+            params = {
+                "tickers": stock_ids,
                 "start": start_str,
                 "end": end_str
             }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiwan_leading_indicator returned empty data")
-        return df  
+            try:
+                frame = self.fetch_data_from_db(["股票代號", *fields], sql, self.engine, params=params)
+            except Exception as e:
+                # The per-measure fetches will query (and report) on their own
+                print(f"Prefetch from {table} failed: {e}")
+                continue
 
-    def fetch_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """PMI製造業指數 : PMI製造業指數"""
-        stock_id = '70100'  
+            parts = dict(tuple(frame.groupby("股票代號", sort=False)))
+            for stock_id in stock_ids:
+                # A 股票代號 without rows is cached empty, so its measures report empty data without re-querying
+                part = parts.get(stock_id, frame.iloc[0:0])
+                self._cache[(table, stock_id)] = (start_str, end_str, part.drop(columns="股票代號"))
+
+        if eco_ids:
+            self._prefetch_economic(eco_ids, start_date, end_date)
+
+    def _prefetch_economic(self, stock_ids: List[str], start_date: DateLike, end_date: DateLike) -> None:
+        """Load 數值 of every 代號 in stock_ids with one query into self._cache, see _eco_series()"""
         field = '數值'
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        start_str = format_date(start_date, '%Y%m')
+        end_str = format_date(end_date, '%Y%m')
+
+        sql = self._eco_batch_query(field)
+        params = {
+            "tickers": stock_ids,
+            "start": start_str,
+            "end": end_str
+        }
+        try:
+            frame = self.fetch_data_from_db(["代號", field], sql, self.engine, params=params)
+        except Exception as e:
+            print(f"Prefetch from md_cm_eco_economics failed: {e}")
+            return
+
+        parts = dict(tuple(frame.groupby("代號", sort=False)))
+        for stock_id in stock_ids:
+            part = parts.get(stock_id, frame.iloc[0:0])
+            self._cache[("md_cm_eco_economics", stock_id)] = (start_str, end_str, part.drop(columns="代號"))
+
+    @staticmethod
+    def _score_case(field: str, thresholds: List[float], scores: List[int], direction: str,
+                    prefix: str = "t") -> Tuple[str, Dict[str, float]]:
+        """
+        CASE WHEN expression scoring field with the same thresholds / scores / direction rules as
+        MeasureScore._apply_thresholds (NULL scores 0), plus its threshold bind parameters.
+        """
+        scores = [int(score) for score in scores]
+        params = {f"{prefix}{i}": float(t) for i, t in enumerate(thresholds)}
+        if direction == "gt":
+            cases = [f"WHEN {field} > :{prefix}{i} THEN {scores[i + 1]}" for i in reversed(range(len(thresholds)))]
+            default = scores[0]
+        else:
+            cases = [f"WHEN {field} < :{prefix}{i} THEN {scores[i]}" for i in range(len(thresholds))]
+            default = scores[-1]
+        return f"CASE WHEN {field} IS NULL THEN 0 {' '.join(cases)} ELSE {default} END", params
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _score_query(table: str, field: str, thresholds: Tuple[float, ...], scores: Tuple[int, ...],
+                     direction: str) -> Tuple[TextClause, Mapping[str, float]]:
+        """SELECT of one SQL-scored TA field and its threshold parameters, built once per spec"""
+        expr, params = MeasureValue._score_case(field, list(thresholds), list(scores), direction)
+        return text(f"""
+            SELECT 日期, {expr} AS score
+            FROM `{table}`
+            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
+            ORDER BY 日期 asc
+        """), MappingProxyType(params)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _score_batch_query(
+        table: str, specs: Tuple[Tuple[str, Tuple[float, ...], Tuple[int, ...], str], ...]
+    ) -> Tuple[TextClause, Mapping[str, float]]:
+        """
+        SELECT of one CASE WHEN column s<i> per (field, thresholds, scores, direction) spec for a
+        list of 股票代號, and its threshold parameters, built once per (table, specs)
+        """
+        columns, params = [], {}
+        for i, (field, thresholds, scores, direction) in enumerate(specs):
+            expr, case_params = MeasureValue._score_case(field, list(thresholds), list(scores), direction,
+                                                         prefix=f"s{i}_t")
+            columns.append(f"{expr} AS s{i}")
+            params.update(case_params)
+        return text(f"""
+            SELECT 日期, 股票代號, {", ".join(columns)}
+            FROM `{table}`
+            WHERE 股票代號 IN :tickers AND 日期 BETWEEN :start AND :end
+            ORDER BY 日期 asc
+        """).bindparams(bindparam("tickers", expanding=True, type_=String)), MappingProxyType(params)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
+    def prefetch_scores(
+        self,
+        specs: List[Tuple[str, List[float], List[int], str]],
+        start_date: DateLike,
+        end_date: DateLike,
+    ) -> None:
         """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_pmi_manufacturing_index returned empty data")
-        return df  
+        Score every (key, thresholds, scores, direction) spec in SQL with one wide query per table:
+        one CASE WHEN column per spec, all 股票代號 in one IN list. Results are kept in
+        self._score_cache for _fetch_score_sql.
+        """
+        start_str = format_date(start_date, '%Y-%m-%d')
+        end_str = format_date(end_date, '%Y-%m-%d')
 
-    def fetch_taiwan_export_orders(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_export_orders : 台灣外銷訂單金額"""
-        stock_id = 'TWG01'  
-        field = '數值'
+        by_table: Dict[str, List[Tuple[str, List[float], List[int], str]]] = {}
+        for spec in specs:
+            by_table.setdefault(self._FIELD_MAP[spec[0]][0], []).append(spec)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        self._score_cache.clear()
+        for table, table_specs in by_table.items():
+            field_specs, tickers = [], []
+            for key, thresholds, scores, direction in table_specs:
+                _, stock_id, field = self._FIELD_MAP[key]
+                field_specs.append((field, tuple(thresholds), tuple(scores), direction))
+                if stock_id not in tickers:
+                    tickers.append(stock_id)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
+            sql, case_params = self._score_batch_query(table, tuple(field_specs))
+            params = dict(case_params)
+            params.update({
+                "tickers": tickers,
                 "start": start_str,
                 "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiwan_export_orders returned empty data")
-        return df 
-    
-    def fetch_taiwan_industrial_production(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_industrial_production : 工業生產指數-非季節調整"""
-        stock_id = '18860'  
-        field = '數值'
+            })
+            try:
+                frame = self.fetch_data_from_db(["股票代號", *(f"s{i}" for i in range(len(table_specs)))],
+                                                sql, self.engine, params=params)
+            except Exception as e:
+                # _fetch_score_sql will query (and report) per measure
+                print(f"Score prefetch from {table} failed: {e}")
+                continue
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+            for i, (key, thresholds, scores, direction) in enumerate(table_specs):
+                stock_id = self._FIELD_MAP[key][1]
+                series = frame.loc[frame["股票代號"] == stock_id, f"s{i}"].rename("score")
+                cache_key = (key, tuple(thresholds), tuple(scores), direction)
+                self._score_cache[cache_key] = (start_str, end_str, series)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
+    def _fetch_score_sql(
+        self,
+        key: str,
+        thresholds: List[float],
+        scores: List[int],
+        direction: str,
+        start_date: DateLike,
+        end_date: DateLike,
+    ) -> pd.Series:
         """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiwan_industrial_production returned empty data")
-        return df   
+        Score the daily TA field _FIELD_MAP[key] inside the database with a CASE WHEN,
+        served from the prefetch_scores() batch when it covers the range.
+        """
+        table, stock_id, field = self._FIELD_MAP[key]
 
+        start_str = format_date(start_date, '%Y-%m-%d')
+        end_str = format_date(end_date, '%Y-%m-%d')
 
-    def fetch_taiwan_trade_balance(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_trade_balance : 貿易收支出入超"""
-        stock_id = '18700'  
-        field = '數值'
+        cached = self._score_cache.get((key, tuple(thresholds), tuple(scores), direction))
+        if cached is not None and cached[0] <= start_str and end_str <= cached[1]:
+            df = cached[2].loc[start_str:end_str]
+            if df.empty:
+                raise EmptyDataError(f"fetch_{key} returned empty data")
+            return df
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        sql, case_params = self._score_query(table, field, tuple(thresholds), tuple(scores), direction)
+        params = dict(case_params)
+        params.update({
+            "ticker": stock_id,
+            "start": start_str,
+            "end": end_str
+        })
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        df = df.div(1000)  # Convert to billions
+        df = self.fetch_data_from_db("score", sql, self.engine, params=params)
+        if df.empty:
+            raise EmptyDataError(f"fetch_{key} returned empty data")
+        return df
 
-        if df.empty: 
-            raise ValueError("fetch_taiwan_trade_balance returned empty data")
-        return df   
-    
-    def fetch_taiwan_retail_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_retail_sales : 台灣零售銷售金額"""
+    def _fetch_field(self, key: str, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Fetch one daily TA field described by _FIELD_MAP[key]"""
+        table, stock_id, field = self._FIELD_MAP[key]
 
-        stock_id = '44220'  
-        field = '數值'
+        start_str = format_date(start_date, '%Y-%m-%d')
+        end_str = format_date(end_date, '%Y-%m-%d')
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        # Any prefetched range covering [start, end] is sliced in memory instead of queried again
+        cached = self._cache.get((table, stock_id))
+        if cached is not None and cached[0] <= start_str and end_str <= cached[1] and field in cached[2].columns:
+            df = cached[2].loc[start_str:end_str, field]
+            if df.empty:
+                raise EmptyDataError(f"fetch_{key} returned empty data")
+            return df
+
+        sql = self._ta_query(table, (field,))
+        params = {
+            "ticker": stock_id,
+            "start": start_str,
+            "end": end_str
+        }
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
         df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        df = df.div(1000)  # Convert to billions
+        if df.empty:
+            raise EmptyDataError(f"fetch_{key} returned empty data")
+        return df
 
-        if df.empty: 
-            raise ValueError("fetch_taiwan_trade_balance returned empty data")
-        return df   
-    
-    def fetch_taiwan_unemployment_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_unemployment_rate : 失業率"""
-        stock_id = '19400'  
+    def _eco_series(self, stock_id: str, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Monthly 數值 of one md_cm_eco_economics 代號, sliced from the prefetched batch when it covers the range"""
         field = '數值'
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        start_str = format_date(start_date, '%Y%m')
+        end_str = format_date(end_date, '%Y%m')
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiwan_unemployment_rate returned empty data")
-        return df
+        cached = self._cache.get(("md_cm_eco_economics", stock_id))
+        if cached is not None and cached[0] <= start_str and end_str <= cached[1]:
+            # Rows are dated on the 1st, so this matches 年月 BETWEEN start AND end
+            return cached[2].loc[pd.to_datetime(start_str, format='%Y%m'):pd.to_datetime(end_str, format='%Y%m'), field]
 
-    def fetch_taiwan_cpi(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_cpi : 消費者物價指數"""
-        stock_id = '18100'  
-        field = '數值'
+        sql = self._eco_query(field)
+        params = {
+            "ticker": stock_id,
+            "start": start_str,
+            "end": end_str
+        }
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        return self.fetch_data_from_db(field, sql, self.engine, params=params)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiwan_cpi returned empty data")
-        return df
-    
-    def fetch_taiwan_m1b_m2(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiwan_m1b_m2 : M1B-M2"""
-        
-        m1b_id = '12301'
-        m2_id = '12501'
-        field = '數值'
+    def _fetch_economic(self, key: str, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Fetch one monthly md_cm_eco_economics series described by _ECO_MAP[key]"""
+        stock_id, divisor = self._ECO_MAP[key]
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        df = self._eco_series(stock_id, start_date, end_date)
+        if df.empty:
+            raise EmptyDataError(f"fetch_{key} returned empty data")
+        # Not divided in place: df may be a view of the prefetched batch in self._cache
+        return df.div(divisor) if divisor != 1 else df  # e.g. 1000: convert to billions
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": m1b_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df_m1b = self.fetch_data_from_db(field, sql, self.engine, params=params)
+    def _fetch_spread(self, key: str, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """Difference of the two md_cm_eco_economics series in _ECO_SPREAD_MAP[key] (e.g. M1B-M2)"""
+        minuend_id, subtrahend_id = self._ECO_SPREAD_MAP[key]
 
-        #取得M2
-        params={
-                "field": field,
-                "ticker": m2_id,
-                "start": start_str,
-                "end": end_str
-            }
-        df_m2 = self.fetch_data_from_db(field, sql, self.engine, params=params)
+        # Both series come from the same prefetched batch when compute_all ran prefetch()
+        minuend = self._eco_series(minuend_id, start_date, end_date)
+        subtrahend = self._eco_series(subtrahend_id, start_date, end_date)
+        if minuend.empty or subtrahend.empty:
+            raise EmptyDataError(f"fetch_{key} returned empty data")
+        return minuend - subtrahend
 
-        #計算M1B-M2
-        df = df_m1b.copy()
-        df = df_m1b - df_m2
-        if df_m1b.empty or df_m2.empty  : 
-            raise ValueError("fetch_taiwan_m1b_m2 returned empty data")
-        return df
+    # ==============================================
+    #   Individual Measure Methods
+    # ==============================================
+    def fetch_taiwan_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """台灣領先指標 : 台灣景氣領先指標"""
+        return self._fetch_economic("taiwan_leading_indicator", start_date, end_date)
 
-    def fetch_taiex_bias(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiex_bias : 60日乖離率"""
-        stock_id = 'TWA00'  # TAIEX
-        field = '乖離率60日'
+    def fetch_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """PMI製造業指數 : PMI製造業指數"""
+        return self._fetch_economic("pmi_manufacturing_index", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+    def fetch_taiwan_export_orders(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_export_orders : 台灣外銷訂單金額"""
+        return self._fetch_economic("taiwan_export_orders", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailystatistics`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_bias returned empty data")
-        return df   
-        
+    def fetch_taiwan_industrial_production(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_industrial_production : 工業生產指數-非季節調整"""
+        return self._fetch_economic("taiwan_industrial_production", start_date, end_date)
 
-    def fetch_otc_bias(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """OTC 指數乖離率_id : 60日乖離率"""
-        stock_id = 'TWC00'  # OTC
-        field = '乖離率60日'
+    def fetch_taiwan_trade_balance(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_trade_balance : 貿易收支出入超"""
+        return self._fetch_economic("taiwan_trade_balance", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+    def fetch_taiwan_retail_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_retail_sales : 台灣零售銷售金額"""
+        return self._fetch_economic("taiwan_retail_sales", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailystatistics`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_otc_bias returned empty data")
-        return df
+    def fetch_taiwan_unemployment_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_unemployment_rate : 失業率"""
+        return self._fetch_economic("taiwan_unemployment_rate", start_date, end_date)
 
-    def fetch_taiex_macd(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """taiex_macd : MACD線"""
-        stock_id = 'TWA00'  # TAIEX
-        field = '月MACD'
+    def fetch_taiwan_cpi(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_cpi : 消費者物價指數"""
+        return self._fetch_economic("taiwan_cpi", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+    def fetch_taiwan_m1b_m2(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiwan_m1b_m2 : M1B-M2"""
+        return self._fetch_spread("taiwan_m1b_m2", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailystatistics`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_macd returned empty data")
-        return df
+    def fetch_taiex_bias(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiex_bias : 60日乖離率"""
+        return self._fetch_field("taiex_bias", start_date, end_date)
 
-    def fetch_otc_macd(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """OTC 指數MACD_id"""
-        stock_id = 'TWC00'  # OTC
-        field = '月MACD'
+    def fetch_otc_bias(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """OTC 指數乖離率_id : 60日乖離率"""
+        return self._fetch_field("otc_bias", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+    def fetch_taiex_macd(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """taiex_macd : MACD線"""
+        return self._fetch_field("taiex_macd", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailystatistics`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_otc_macd returned empty data")
-        return df
+    def fetch_otc_macd(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
+        """OTC 指數MACD_id"""
+        return self._fetch_field("otc_macd", start_date, end_date)
 
     def fetch_taiex_dif(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_dif"""
-        stock_id = 'TWA00'  # TAIEX
-        field = '月DIF'
+        return self._fetch_field("taiex_dif", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailystatistics`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_dif returned empty data")
-        return df
-    
     def fetch_taiex_adx(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_adx"""
-        stock_id = 'TWA00'  # TAIEX
-        field = '月ADX14'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+        return self._fetch_field("taiex_adx", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailystatistics`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_adx returned empty data")
-        return df
-    
     def fetch_taiex_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_pe"""
-        stock_id = 'TWA00'  # TAIEX
-        field = '本益比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+        return self._fetch_field("taiex_pe", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
     def fetch_tw50_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """tw50_pe"""
-        stock_id = 'TWA50'  # TAIEX
-        field = '本益比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+        return self._fetch_field("tw50_pe", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
     def fetch_mid100_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """mid100_pe"""
-        stock_id = 'TWA51'  
-        field = '本益比'
+        return self._fetch_field("mid100_pe", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
     def fetch_highdiv_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """highdiv_pe"""
-        stock_id = 'TWA54'  
-        field = '本益比'
+        return self._fetch_field("highdiv_pe", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
     def fetch_otc_pe(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """OTC 指數本益比_id"""
-
-        stock_id = 'TWC00'  # OTC
-        field = '本益比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
+        return self._fetch_field("otc_pe", start_date, end_date)
 
     def fetch_taiex_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """taiex_pb"""
-        stock_id = 'TWA00'  # TAIEX
-        field = '股價淨值比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
+        return self._fetch_field("taiex_pb", start_date, end_date)
 
     def fetch_tw50_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """tw50_pb"""
-        stock_id = 'TWA50'  # TAIEX
-        field = '股價淨值比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
+        return self._fetch_field("tw50_pb", start_date, end_date)
 
     def fetch_mid100_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """mid100_pb"""
-        stock_id = 'TWA51'  # TAIEX
-        field = '股價淨值比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
+        return self._fetch_field("mid100_pb", start_date, end_date)
 
     def fetch_highdiv_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """highdiv_pb"""
-        stock_id = 'TWA54'  # TAIEX
-        field = '股價淨值比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
-
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
+        return self._fetch_field("highdiv_pb", start_date, end_date)
 
     def fetch_otc_pb(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """OTC 指數股價淨值比_id"""
-        stock_id = 'TWC00'  # OTC
-        field = '股價淨值比'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y-%m-%d')
+        return self._fetch_field("otc_pb", start_date, end_date)
 
-        sql = f"""
-            SELECT 日期, {field}
-            FROM `md_cm_ta_dailyquotes`
-            WHERE 股票代號 = :ticker AND 日期 BETWEEN :start AND :end
-            ORDER BY 日期 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_taiex_pe returned empty data")
-        return df
     #海外指標
     def fetch_global_gdp_real_growth_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """global_gdp_real_growth_rate : 全球GDP實質成長率"""
-        stock_id = 'IMF40'  
-        field = '數值'
+        return self._fetch_economic("global_gdp_real_growth_rate", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_global_gdp_real_growth_rate returned empty data")
-        return df 
-    
     def fetch_us_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_leading_indicator : 美國領先指標"""
-        stock_id = 'USA55'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        return self._fetch_economic("us_leading_indicator", start_date, end_date)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("us_leading_indicator returned empty data")
-        return df
-    
     def fetch_us_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_pmi_manufacturing_index : 美國PMI製造業指數"""
-        stock_id = 'USA04'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        return self._fetch_economic("us_pmi_manufacturing_index", start_date, end_date)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_us_pmi_manufacturing_index returned empty data")
-        return df
-    
     def fetch_us_durable_goods_orders(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_durable_goods_orders : 美國耐久財訂單金額"""
-        stock_id = 'USA85'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        return self._fetch_economic("us_durable_goods_orders", start_date, end_date)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_us_durable_goods_orders returned empty data")
-        return df
-    
     def fetch_us_retail_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_retail_sales : 美國零售銷售金額"""
-        stock_id = 'USA87'  
-        field = '數值'
+        return self._fetch_economic("us_retail_sales", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-
-        df = df.div(1000)  # Convert to billions
-        if df.empty: 
-            raise ValueError("fetch_us_retail_sales returned empty data")
-        return df
-    
     def fetch_us_employment_mom(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_employment_mom : 美國就業月變動人數"""
-        stock_id = 'USA24'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        return self._fetch_economic("us_employment_mom", start_date, end_date)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_us_employment_mom returned empty data")
-        return df
-    
     def fetch_us_unemployment_rate(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_unemployment_rate : 美國失業率"""
-        stock_id = 'USA20'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
+        return self._fetch_economic("us_unemployment_rate", start_date, end_date)
 
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("us_unemployment_rate returned empty data")
-        return df
-    
     def fetch_us_cpi_yoy(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_cpi_yoy : 美國消費者物價指數年增率"""
-        stock_id = 'USA39'  
-        field = '數值'
+        return self._fetch_economic("us_cpi_yoy", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_us_cpi_yoy returned empty data")
-        return df
-    
     def fetch_us_existing_home_sales(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_existing_home_sales : 美國成屋銷售量"""
-        stock_id = 'USA33'  
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_us_existing_home_sales returned empty data")
-        return df
+        return self._fetch_economic("us_existing_home_sales", start_date, end_date)
 
     def fetch_us_m1_m2(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """us_m1_m2 : m1-M2"""
-        
-        m1_id = 'USA57'
-        m2_id = 'USA58'
-        field = '數值'
-
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": m1_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df_m1 = self.fetch_data_from_db(field, sql, self.engine, params=params)
-
-        #取得M2
-        params={
-                "field": field,
-                "ticker": m2_id,
-                "start": start_str,
-                "end": end_str
-            }
-        df_m2 = self.fetch_data_from_db(field, sql, self.engine, params=params)
+        return self._fetch_spread("us_m1_m2", start_date, end_date)
 
-        #計算m1-M2
-        df = df_m1.copy()
-        df = df_m1 - df_m2
-        if df_m1.empty or df_m2.empty  : 
-            raise ValueError("fetch_us_m1_m2 returned empty data")
-        return df
-    
     def fetch_eu_leading_indicator(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """eu_leading_indicator : 歐洲領先指標"""
-        stock_id = 'EUR00'  
-        field = '數值'
+        return self._fetch_economic("eu_leading_indicator", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("eu_leading_indicator returned empty data")
-        return df
-    
     def fetch_eu_pmi_manufacturing_index(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """eu_pmi_manufacturing_index : 歐洲PMI製造業指數"""
-        stock_id = 'EUR06'  
-        field = '數值'
+        return self._fetch_economic("eu_pmi_manufacturing_index", start_date, end_date)
 
-        start_str = pd.to_datetime(start_date).strftime('%Y%m')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m')
-
-        sql = f"""
-            SELECT CONCAT(年月,'01') as 日期, {field}
-            FROM `md_cm_eco_economics`
-            WHERE 代號 = :ticker AND 年月 BETWEEN :start AND :end
-            ORDER BY 年月 asc
-        """
-        params={
-                "field": field,
-                "ticker": stock_id,
-                "start": start_str,
-                "end": end_str
-            }
-        
-        df = self.fetch_data_from_db(field, sql, self.engine, params=params)
-        if df.empty: 
-            raise ValueError("fetch_us_pmi_manufacturing_index returned empty data")
-        return df
-    
     def fetch_eu_economic_sentiment(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
         """eu_economic_sentiment : 歐洲經濟景氣指數""" 
         df = ak.macro_euro_zew_economic_sentiment()
@@ -1156,15 +855,5 @@ class MeasureValue:
         df.index = pd.to_datetime(df.index)
         df = df.loc[start_date:end_date,'今值']
         if df.empty: 
-            raise ValueError("fetch_eu_economic_sentiment returned empty data")
+            raise EmptyDataError("fetch_eu_economic_sentiment returned empty data")
         return df
-
-    def fetch_eu_economic_sentiment(self, start_date: DateLike, end_date: DateLike) -> pd.Series:
-        """eu_economic_sentiment : 歐洲經濟景氣指數""" 
-        df = ak.macro_euro_zew_economic_sentiment()
-        df.set_index("日期", inplace=True)
-        df.index = pd.to_datetime(df.index)
-        df = df.loc[start_date:end_date,'今值']
-        if df.empty: 
-            raise ValueError("fetch_eu_economic_sentiment returned empty data")
-        return df
\ No newline at end of file
@@ -0,0 +1,48 @@
+import unittest
+import os
+import sys
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.csv_writer import _format_index
+
+
+class TestFormatIndex(unittest.TestCase):
+    INDEX = pd.DatetimeIndex(["2023-12-31", "2024-01-01", "2024-02-29 23:59:59.999999999", "2025-06-15"], name="日期")
+    FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d", "%Y.%m.%d", "%d/%m/%Y", "%Y-%m")
+
+    def assertLabelsEqual(self, result, expected):
+        pd.testing.assert_index_equal(pd.Index(result, dtype=object), pd.Index(expected, dtype=object),
+                                      check_names=False)
+
+    def test_matches_strftime(self):
+        for fmt in self.FORMATS:
+            with self.subTest(fmt=fmt):
+                self.assertLabelsEqual(_format_index(self.INDEX, fmt), self.INDEX.strftime(fmt))
+
+    def test_nat_matches_strftime(self):
+        index = self.INDEX.insert(1, pd.NaT)
+        for fmt in self.FORMATS:
+            with self.subTest(fmt=fmt):
+                self.assertLabelsEqual(_format_index(index, fmt), index.strftime(fmt))
+
+    def test_tz_aware_matches_strftime(self):
+        index = self.INDEX.tz_localize("Asia/Taipei")
+        self.assertLabelsEqual(_format_index(index, "%Y-%m-%d"), index.strftime("%Y-%m-%d"))
+
+    def test_non_datetime_index_is_stringified(self):
+        index = pd.Index(["a", "b"])
+        self.assertLabelsEqual(_format_index(index, "%Y-%m-%d"), ["a", "b"])
+        self.assertLabelsEqual(_format_index(pd.RangeIndex(3), "%Y-%m-%d"), ["0", "1", "2"])
+
+    def test_no_date_format_matches_to_csv(self):
+        index = pd.DatetimeIndex(["2024-01-01", "2024-01-02"])
+        self.assertLabelsEqual(_format_index(index, None), ["2024-01-01", "2024-01-02"])
+        expected = pd.Series(1, index=self.INDEX).to_csv(header=False).splitlines()
+        self.assertLabelsEqual(_format_index(self.INDEX, None), [line.split(",")[0] for line in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import os
+import sys
+from datetime import date, datetime
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.data_fetcher import format_date
+
+
+class TestFormatDate(unittest.TestCase):
+    def test_iso_string(self):
+        self.assertEqual(format_date("2024-03-05", "%Y-%m-%d"), "2024-03-05")
+        self.assertEqual(format_date("2024-03-05", "%Y%m"), "202403")
+        self.assertEqual(format_date("2024-03-05", "%Y/%m/%d"), "2024/03/05")
+
+    def test_invalid_iso_string_raises(self):
+        for value in ("2024-13-45", "2023-02-29", "2024-00-10"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    format_date(value, "%Y%m")
+                with self.assertRaises(ValueError):
+                    format_date(value, "%Y-%m-%d")
+
+    def test_other_strings_are_parsed(self):
+        self.assertEqual(format_date("2024/03/05", "%Y%m"), "202403")
+        self.assertEqual(format_date("20240305", "%Y-%m-%d"), "2024-03-05")
+
+    def test_date_and_timestamp(self):
+        for value in (date(2024, 3, 5), datetime(2024, 3, 5, 13, 30), pd.Timestamp("2024-03-05")):
+            with self.subTest(value=value):
+                self.assertEqual(format_date(value, "%Y%m"), "202403")
+                self.assertEqual(format_date(value, "%Y-%m-%d"), "2024-03-05")
+
+    def test_tz_aware_same_instant_formats_per_zone(self):
+        taipei = pd.Timestamp("2024-01-01 02:00", tz="Asia/Taipei")
+        utc = taipei.tz_convert("UTC")
+        # Equal (and equally hashed) instants, so a shared cache entry would hand back the first one's string
+        self.assertEqual(taipei, utc)
+        self.assertEqual(format_date(taipei, "%Y-%m-%d"), "2024-01-01")
+        self.assertEqual(format_date(utc, "%Y-%m-%d"), "2023-12-31")
+        self.assertEqual(format_date(taipei.to_pydatetime(), "%Y%m"), "202401")
+        self.assertEqual(format_date(utc.to_pydatetime(), "%Y%m"), "202312")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+import os
+import sys
+import tempfile
+import pandas as pd
+from sqlalchemy import create_engine
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.config import Config
+from core.data_fetcher import EmptyDataError
+from core.measure_value import MeasureValue
+
+
+class FakeMeasureValue(MeasureValue):
+    """MeasureValue with one daily measure whose fetches are recorded instead of queried"""
+
+    def __init__(self, engine):
+        self.calls = []
+        self.error = None
+        super().__init__("unused.json", engine=engine, measure_profile={"fake": {"func_value": "fetch_fake"}})
+
+    def fetch_fake(self, start_date, end_date):
+        self.calls.append((pd.Timestamp(start_date), pd.Timestamp(end_date)))
+        if self.error is not None:
+            raise self.error
+        index = pd.date_range(start_date, end_date, freq="D", name="日期")
+        # A value derived from the date, so every fetch agrees on the rows it shares
+        return pd.Series((index - pd.Timestamp("2024-01-01")).days.astype(float), index=index)
+
+
+class TestMeasureHistory(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for name, value in {"CACHE_DIR": tmp.name, "USE_CACHE": True, "MEASURE_CACHE_TTL": 3600}.items():
+            patcher = mock.patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.engine = create_engine("sqlite://")
+
+    def run_once(self, start, end, engine=None):
+        # A new instance per run, like a new process reading the history from disk
+        mv = FakeMeasureValue(engine or self.engine)
+        return mv, mv.compute_one("fake", start, end)
+
+    def assertSeriesEqual(self, left, right):
+        # A fetched date_range carries a freq, a cached or merged history does not
+        pd.testing.assert_series_equal(left, right, check_freq=False)
+
+    def expected(self, start, end):
+        return FakeMeasureValue(self.engine).fetch_fake(start, end).rename("fake")
+
+    def test_cold_run_fetches_full_range(self):
+        mv, s = self.run_once("2024-01-01", "2024-03-31")
+        self.assertEqual(mv.calls, [(pd.Timestamp("2024-01-01"), pd.Timestamp("2024-03-31"))])
+        self.assertSeriesEqual(s, self.expected("2024-01-01", "2024-03-31"))
+
+    def test_warm_run_fetches_only_tail(self):
+        self.run_once("2024-01-01", "2024-03-31")
+        mv, s = self.run_once("2024-01-01", "2024-04-30")
+        self.assertEqual(mv.calls, [(pd.Timestamp("2024-03-31"), pd.Timestamp("2024-04-30"))])
+        self.assertSeriesEqual(s, self.expected("2024-01-01", "2024-04-30"))
+
+    def test_warm_run_inside_history_is_sliced(self):
+        self.run_once("2024-01-01", "2024-03-31")
+        mv, s = self.run_once("2024-02-01", "2024-02-29")
+        self.assertEqual(mv.calls, [])
+        self.assertSeriesEqual(s, self.expected("2024-02-01", "2024-02-29"))
+
+    def test_earlier_start_refetches_full_range(self):
+        self.run_once("2024-02-01", "2024-03-31")
+        mv, s = self.run_once("2024-01-01", "2024-03-31")
+        self.assertEqual(mv.calls, [(pd.Timestamp("2024-01-01"), pd.Timestamp("2024-03-31"))])
+        self.assertSeriesEqual(s, self.expected("2024-01-01", "2024-03-31"))
+
+    def test_past_ttl_refetches_full_range(self):
+        self.run_once("2024-01-01", "2024-03-31")
+        with mock.patch.object(Config, "MEASURE_CACHE_TTL", -1):
+            mv, s = self.run_once("2024-01-01", "2024-04-30")
+        self.assertEqual(mv.calls, [(pd.Timestamp("2024-01-01"), pd.Timestamp("2024-04-30"))])
+        self.assertSeriesEqual(s, self.expected("2024-01-01", "2024-04-30"))
+
+    def test_histories_are_kept_per_engine(self):
+        self.run_once("2024-01-01", "2024-03-31")
+        other = create_engine(f"sqlite:///{os.path.join(Config.CACHE_DIR, 'other.db')}")
+        mv, _ = self.run_once("2024-01-01", "2024-03-31", engine=other)
+        self.assertEqual(len(mv.calls), 1)
+
+    def test_empty_tail_keeps_history(self):
+        self.run_once("2024-01-01", "2024-03-31")
+        mv = FakeMeasureValue(self.engine)
+        mv.error = EmptyDataError("fetch_fake returned empty data")
+        s = mv.compute_one("fake", "2024-01-01", "2024-04-30")
+        self.assertSeriesEqual(s, self.expected("2024-01-01", "2024-03-31"))
+
+    def test_tail_error_is_reported(self):
+        self.run_once("2024-01-01", "2024-03-31")
+        mv = FakeMeasureValue(self.engine)
+        mv.error = ValueError("could not convert string to float")
+        with self.assertRaises(ValueError):
+            mv.compute_one("fake", "2024-01-01", "2024-04-30")
+        self.assertTrue(mv.compute_all("2024-01-01", "2024-04-30").empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
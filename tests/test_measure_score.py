@@ -0,0 +1,92 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.measure_score import MeasureScore
+from core.measure_value import MeasureValue
+
+
+def baseline_gt(s, low, high):
+    # The per-element rule the calc_score_* methods applied before the profile thresholds
+    return s.apply(lambda x: 4 if x > high else (3 if x > low else 0))
+
+
+def baseline_lt(s, low, high):
+    return s.apply(lambda x: 4 if x < low else (3 if x < high else 0))
+
+
+class TestApplyThresholds(unittest.TestCase):
+    LOW, HIGH = -2.68, 2.72
+    # On each threshold, between them, below the first, above the last, and NaN
+    VALUES = pd.Series([LOW, HIGH, 0.0, -1e9, 1e9, LOW - 1e-9, HIGH + 1e-9, np.nan],
+                       index=pd.date_range("2024-01-01", periods=8, name="日期"), name="value")
+
+    def assertScoresEqual(self, result, expected):
+        pd.testing.assert_series_equal(result, expected.astype(np.int8))
+
+    def test_gt_matches_baseline(self):
+        result = MeasureScore._apply_thresholds(self.VALUES, [self.LOW, self.HIGH], [0, 3, 4], "gt")
+        self.assertScoresEqual(result, baseline_gt(self.VALUES, self.LOW, self.HIGH))
+
+    def test_lt_matches_baseline(self):
+        result = MeasureScore._apply_thresholds(self.VALUES, [self.LOW, self.HIGH], [4, 3, 0], "lt")
+        self.assertScoresEqual(result, baseline_lt(self.VALUES, self.LOW, self.HIGH))
+
+    def test_on_threshold_stays_in_lower_bucket_for_gt(self):
+        result = MeasureScore._apply_thresholds(self.VALUES, [self.LOW, self.HIGH], [0, 3, 4], "gt")
+        self.assertEqual(result.iloc[:2].tolist(), [0, 3])
+
+    def test_on_threshold_moves_to_next_bucket_for_lt(self):
+        result = MeasureScore._apply_thresholds(self.VALUES, [self.LOW, self.HIGH], [4, 3, 0], "lt")
+        self.assertEqual(result.iloc[:2].tolist(), [3, 0])
+
+    def test_nan_scores_zero(self):
+        for direction, scores in (("gt", [0, 3, 4]), ("lt", [4, 3, 0])):
+            result = MeasureScore._apply_thresholds(self.VALUES, [self.LOW, self.HIGH], scores, direction)
+            self.assertEqual(result.iloc[-1], 0)
+
+
+class TestScoreSql(unittest.TestCase):
+    """The SQL CASE WHEN scoring must agree with _apply_thresholds on the same values"""
+
+    THRESHOLDS = (-2.68, 2.72)
+    SPECS = (("gt", (0, 3, 4)), ("lt", (4, 3, 0)))
+    VALUES = TestApplyThresholds.VALUES
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        # NaN is written as NULL
+        pd.DataFrame({"日期": self.VALUES.index.strftime("%Y-%m-%d"), "股票代號": "TWA00",
+                      "value": self.VALUES.to_numpy()}).to_sql("ta", self.engine, index=False)
+
+    def expected(self, scores, direction):
+        return MeasureScore._apply_thresholds(self.VALUES, list(self.THRESHOLDS), list(scores), direction)
+
+    def test_single_query_matches_apply_thresholds(self):
+        for direction, scores in self.SPECS:
+            with self.subTest(direction=direction):
+                sql, case_params = MeasureValue._score_query("ta", "value", self.THRESHOLDS, scores, direction)
+                params = {**case_params, "ticker": "TWA00", "start": "2024-01-01", "end": "2024-01-08"}
+                with self.engine.connect() as conn:
+                    df = pd.read_sql(sql, conn, params=params)
+                self.assertEqual(df["score"].tolist(), self.expected(scores, direction).tolist())
+
+    def test_batch_query_matches_apply_thresholds(self):
+        specs = tuple(("value", self.THRESHOLDS, scores, direction) for direction, scores in self.SPECS)
+        sql, case_params = MeasureValue._score_batch_query("ta", specs)
+        params = {**case_params, "tickers": ["TWA00"], "start": "2024-01-01", "end": "2024-01-08"}
+        with self.engine.connect() as conn:
+            df = pd.read_sql(sql, conn, params=params)
+        for i, (direction, scores) in enumerate(self.SPECS):
+            with self.subTest(direction=direction):
+                self.assertEqual(df[f"s{i}"].tolist(), self.expected(scores, direction).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.measure_value import assemble_series, downsample
+
+
+def daily(start, periods, step=1.0, name="日期"):
+    index = pd.date_range(start, periods=periods, freq="D", name=name)
+    return pd.Series(np.arange(periods) * step, index=index)
+
+
+def monthly(start, periods):
+    index = pd.date_range(start, periods=periods, freq="MS", name="日期")
+    return pd.Series(np.arange(periods) + 100.0, index=index)
+
+
+class TestAssembleSeries(unittest.TestCase):
+    def baseline(self, series_dict, how="outer"):
+        return pd.concat(series_dict.values(), axis=1, join=how).ffill()
+
+    def assertMatchesBaseline(self, series_dict, how="outer"):
+        pd.testing.assert_frame_equal(assemble_series(series_dict, how),
+                                      self.baseline(series_dict, how), check_freq=False)
+
+    def test_misaligned_and_overlapping_indexes(self):
+        a = daily("2024-01-01", 10)
+        b = daily("2024-01-05", 20, step=0.5)
+        # Gaps inside a series, so the union has rows only some series hold
+        c = daily("2024-01-03", 15).iloc[::3].rename("c")
+        self.assertMatchesBaseline({"a": a.rename("a"), "b": b.rename("b"), "c": c})
+
+    def test_daily_and_monthly_series(self):
+        self.assertMatchesBaseline({"d": daily("2024-01-15", 60).rename("d"),
+                                    "m": monthly("2023-12-01", 4).rename("m")})
+
+    def test_nan_inside_a_series_is_forward_filled(self):
+        a = daily("2024-01-01", 6).rename("a")
+        a.iloc[2] = np.nan
+        self.assertMatchesBaseline({"a": a, "b": daily("2024-01-04", 6).rename("b")})
+
+    def test_differently_named_indexes(self):
+        self.assertMatchesBaseline({"a": daily("2024-01-01", 5).rename("a"),
+                                    "b": daily("2024-01-03", 5, name="date").rename("b")})
+
+    def test_inner_join_uses_concat(self):
+        self.assertMatchesBaseline({"a": daily("2024-01-01", 10).rename("a"),
+                                    "b": daily("2024-01-05", 10).rename("b")}, how="inner")
+
+
+def baseline_downsample(df, frequency):
+    # compute_all's downsampling before the shared downsample() helper
+    df = df.groupby(df.index.to_period(frequency)).tail(1)
+    df.index = df.index.to_period(frequency).to_timestamp(how='end')
+    return df
+
+
+class TestDownsample(unittest.TestCase):
+    def frame(self):
+        # Weekends and a holiday week missing, plus a monthly series starting late
+        index = pd.bdate_range("2024-01-01", "2024-04-30", name="日期").delete(range(20, 25))
+        values = pd.Series(np.arange(len(index), dtype=float), index=index)
+        return assemble_series({"d": values.rename("d"), "m": monthly("2024-02-01", 3).rename("m")})
+
+    def assertMatchesBaseline(self, df, frequency):
+        pd.testing.assert_frame_equal(downsample(df, frequency), baseline_downsample(df, frequency), check_freq=False)
+
+    def test_daily_with_missing_days(self):
+        self.assertMatchesBaseline(self.frame(), "D")
+
+    def test_daily_with_intraday_stamps_uses_groupby(self):
+        df = self.frame()
+        df.index = df.index + pd.Timedelta(hours=13)
+        self.assertMatchesBaseline(df, "D")
+
+    def test_monthly(self):
+        self.assertMatchesBaseline(self.frame(), "M")
+
+    def test_quarterly(self):
+        self.assertMatchesBaseline(self.frame(), "Q")
+
+
+if __name__ == '__main__':
+    unittest.main()